@@ -1,8 +1,12 @@
 """Job execution logic."""
+import itertools
+import os
 import threading
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from uuid import uuid4
+from typing import Dict, Optional
 
 from job_scheduler.models import Job
 from job_scheduler.executors import TaskExecutorFactory
@@ -11,49 +15,113 @@ from .scheduled_job import ScheduledJob
 
 logger = logging.getLogger(__name__)
 
+# Execution IDs only need to be unique, not unpredictable: a per-process prefix
+# (start time + pid) plus a counter avoids an os.urandom() call per execution
+_execution_id_prefix = ""
+_execution_counter = itertools.count(1)
+
+
+def _reset_execution_ids() -> None:
+    """Start a fresh execution ID sequence (at import and in forked children)."""
+    global _execution_id_prefix, _execution_counter
+    _execution_id_prefix = f"{time.time_ns():x}-{os.getpid():x}-"
+    _execution_counter = itertools.count(1)
+
+
+def _new_execution_id() -> str:
+    """Get an execution ID unique across processes and restarts."""
+    return f"{_execution_id_prefix}{next(_execution_counter):x}"
+
+
+_reset_execution_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_execution_ids)
+
 
 class JobExecutor:
     """Handles execution of scheduled jobs."""
     
-    def __init__(self, job_logger: JobLogger, scheduler_logger: SchedulerLogger):
+    def __init__(self, job_logger: JobLogger, scheduler_logger: SchedulerLogger,
+                 max_workers: int = 50, task_type_workers: Optional[Dict[str, int]] = None):
         """
         Initialize the job executor.
         
         Args:
             job_logger: Logger for job execution logs
             scheduler_logger: Logger for scheduler events
+            max_workers: Size of the shared worker pool
+            task_type_workers: Optional task type -> pool size mapping giving
+                those task types a dedicated pool, so slow tasks cannot
+                hold up the rest
         """
         self.job_logger = job_logger
         self.scheduler_logger = scheduler_logger
+        self.max_workers = max_workers
+        self.task_type_workers = dict(task_type_workers or {})
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._pools_lock = threading.Lock()
+    
+    def _get_pool(self, task_type: str) -> ThreadPoolExecutor:
+        """Get the worker pool for a task type, creating it on first use."""
+        key = task_type if task_type in self.task_type_workers else ""
+        pool = self._pools.get(key)
+        if pool is None:
+            with self._pools_lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    pool = ThreadPoolExecutor(
+                        max_workers=self.task_type_workers.get(key, self.max_workers),
+                        thread_name_prefix=f"jobexec-{key}" if key else "jobexec"
+                    )
+                    self._pools[key] = pool
+        return pool
+    
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Shut down the worker pools.
+        
+        Args:
+            wait: Wait for queued and running executions to finish and their
+                logs to be written; when False, queued executions are dropped
+        """
+        with self._pools_lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+        if wait:
+            self.job_logger.flush()
     
     def execute(self, scheduled_job: ScheduledJob) -> None:
         """
-        Execute a scheduled job in a separate thread.
+        Execute a scheduled job on a worker pool thread.
         
         Args:
             scheduled_job: The scheduled job to execute
         """
         def run():
             job = scheduled_job.job
-            execution_id = uuid4().hex
+            execution_id = _new_execution_id()
             start_time = datetime.now(timezone.utc)
+            # Duration comes from the monotonic clock: cheaper than datetime
+            # arithmetic and immune to wall-clock steps mid-execution
+            start_mono = time.monotonic()
             
             # Log to main logger
-            logger.info(
-                f"Job execution started - ID: {job.job_id}, "
-                f"Execution ID: {execution_id}, Time: {start_time.isoformat()}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Job execution started - ID: %s, Execution ID: %s, Time: %s",
+                    job.job_id, execution_id, start_time.isoformat()
+                )
             
             # Get command string if it's an execute_command task
-            command = ""
-            if hasattr(job.task, 'command'):
-                command = job.task.command
+            command = scheduled_job.command_extractor(job.task)
             
             # Execute the task
-            executor = TaskExecutorFactory.get_executor(job.task.type)
+            executor = scheduled_job.executor or TaskExecutorFactory.get_executor(job.task.type)
             success, stdout, stderr, exit_code = executor.execute(job.task)
+            duration_seconds = time.monotonic() - start_mono
             end_time = datetime.now(timezone.utc)
-            duration_seconds = (end_time - start_time).total_seconds()
             status = "SUCCESS" if success else "FAILURE"
             
             # Log to execution log file
@@ -71,15 +139,14 @@ class JobExecutor:
                     stderr=stderr
                 )
             except Exception as e:
-                logger.error(f"Failed to log execution to job log file for {job.job_id}: {e}", exc_info=True)
+                logger.error("Failed to log execution to job log file for %s: %s", job.job_id, e, exc_info=True)
                 self.scheduler_logger.log_error(job_id=job.job_id, error_msg=f"Failed to write execution log: {e}")
             
             # Log to main logger
             logger.info(
-                f"Job execution completed - ID: {job.job_id}, "
-                f"Execution ID: {execution_id}, Status: {status}"
+                "Job execution completed - ID: %s, Execution ID: %s, Status: %s",
+                job.job_id, execution_id, status
             )
         
-        thread = threading.Thread(target=run, daemon=True)
-        thread.start()
+        self._get_pool(scheduled_job.job.task.type).submit(run)
 
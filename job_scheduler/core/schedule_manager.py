@@ -1,16 +1,82 @@
 """Schedule management and job scheduling logic."""
 from datetime import datetime, timezone
+from functools import lru_cache
 from croniter import croniter
 import logging
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 from job_scheduler.models import Job
+from job_scheduler.executors import TaskExecutorFactory
 from .scheduled_job import ScheduledJob, OneTimeScheduledJob, RecurringScheduledJob
 from job_scheduler.logging import SchedulerLogger
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _parsed_fields(schedule_str: str) -> Tuple[Any, ...]:
+    """
+    Expand a cron expression into croniter's field structure, once per string.
+    
+    Args:
+        schedule_str: The cron expression
+        
+    Returns:
+        The tuple produced by croniter's field expansion
+    """
+    return croniter._expand(schedule_str)
+
+
+@lru_cache(maxsize=1024)
+def _parse_schedule_time(schedule_str: str) -> datetime:
+    """
+    Parse a one-time schedule into an aware datetime, once per string.
+    
+    Args:
+        schedule_str: The ISO 8601 timestamp (a trailing 'Z' and naive
+            timestamps are taken as UTC), or whole epoch seconds when the
+            digits are not a compact ISO 8601 date such as "20300101"
+        
+    Returns:
+        The scheduled time
+        
+    Raises:
+        ValueError: If the timestamp cannot be parsed
+    """
+    # Handle 'Z' timezone indicator (UTC)
+    if schedule_str.endswith('Z'):
+        schedule_str = schedule_str[:-1] + '+00:00'
+    try:
+        schedule_time = datetime.fromisoformat(schedule_str)
+    except ValueError:
+        if not (schedule_str.isascii() and schedule_str.isdigit()):
+            raise
+        try:
+            return datetime.fromtimestamp(int(schedule_str), timezone.utc)
+        except (OverflowError, OSError) as e:
+            raise ValueError(f"Epoch timestamp out of range: {schedule_str}") from e
+    if schedule_time.tzinfo is None:
+        schedule_time = schedule_time.replace(tzinfo=timezone.utc)
+    return schedule_time
+
+
+class _CachedCroniter(croniter):
+    """croniter whose regex-based field expansion is served from a cache."""
+    
+    @classmethod
+    def _expand(cls, expr_format, hash_id=None, **kwargs):
+        if hash_id is not None or any(kwargs.values()):
+            return super()._expand(expr_format, hash_id=hash_id, **kwargs)
+        # croniter mutates the expanded fields while computing runs, so every
+        # instance gets its own copy of the cached lists and sets.
+        expanded, nth_weekday_of_month, *rest = _parsed_fields(expr_format)
+        return (
+            [list(field) for field in expanded],
+            {day: set(nth) for day, nth in nth_weekday_of_month.items()},
+            *rest,
+        )
+
+
 class ScheduleManager:
     """Manages scheduling of jobs."""
     
@@ -33,10 +99,22 @@ class ScheduleManager:
         Returns:
             ScheduledJob instance or None if scheduling failed
         """
+        # Resolve the task executor once here rather than on every execution
+        try:
+            executor = TaskExecutorFactory.get_executor(job.task.type)
+        except ValueError as e:
+            error_msg = f"Cannot schedule job {job.job_id}: {e}"
+            logger.error(error_msg)
+            self.scheduler_logger.log_error(job_id=job.job_id, error_msg=error_msg)
+            return None
+        
         if job.is_one_time_schedule():
-            return self._create_one_time_job(job)
+            scheduled_job = self._create_one_time_job(job)
         else:
-            return self._create_recurring_job(job)
+            scheduled_job = self._create_recurring_job(job)
+        if scheduled_job:
+            scheduled_job.executor = executor
+        return scheduled_job
     
     def _create_one_time_job(self, job: Job) -> Optional[ScheduledJob]:
         """
@@ -49,14 +127,7 @@ class ScheduleManager:
             OneTimeScheduledJob instance or None if scheduling failed
         """
         try:
-            schedule_str = job.schedule
-            # Handle 'Z' timezone indicator (UTC)
-            if schedule_str.endswith('Z'):
-                schedule_str = schedule_str[:-1] + '+00:00'
-            # Parse the timestamp
-            schedule_time = datetime.fromisoformat(schedule_str)
-            if schedule_time.tzinfo is None:
-                schedule_time = schedule_time.replace(tzinfo=timezone.utc)
+            schedule_time = _parse_schedule_time(job.schedule)
             
             # Check if the one-time job is in the past
             now = datetime.now(timezone.utc)
@@ -85,7 +156,7 @@ class ScheduleManager:
             RecurringScheduledJob instance or None if scheduling failed
         """
         try:
-            cron = croniter(job.schedule, datetime.now(timezone.utc))
+            cron = _CachedCroniter(job.schedule, datetime.now(timezone.utc))
             return RecurringScheduledJob(job, cron)
         except Exception as e:
             error_msg = f"Invalid cron expression for job {job.job_id}: {e}"
@@ -1,66 +1,206 @@
 """Scheduled job classes for different schedule types."""
+import logging
+import re
+import time
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable, Dict, Optional, cast
 
-from job_scheduler.models import Job
+from job_scheduler.models import Job, Task, ExecuteCommandTask
+from job_scheduler.executors import TaskExecutor
+
+logger = logging.getLogger(__name__)
+
+def _command(task: Task) -> str:
+    return cast(ExecuteCommandTask, task).command
+
+
+def _no_command(task: Task) -> str:
+    return ""
+
+
+# Task type -> function returning the command string recorded in execution logs
+_COMMAND_EXTRACTORS: Dict[str, Callable[[Task], str]] = {
+    'execute_command': _command,
+}
+
+
+_EVERY_N_MINUTES = re.compile(r"^\*(?:/(\d+))?\s+\*\s+\*\s+\*\s+\*$")
+_EVERY_N_HOURS = re.compile(r"^(\d+)\s+\*(?:/(\d+))?\s+\*\s+\*\s+\*$")
+_DAILY = re.compile(r"^(\d+)\s+(\d+)\s+\*\s+\*\s+\*$")
+_WEEKLY = re.compile(r"^(\d+)\s+(\d+)\s+\*\s+\*\s+[0-7]$")
+# Cron macros with evenly spaced runs, expanded before matching
+_MACROS = {
+    '@hourly': '0 * * * *',
+    '@daily': '0 0 * * *',
+    '@midnight': '0 0 * * *',
+    '@weekly': '0 0 * * 0',
+}
+
+
+def _fast_step(schedule: str) -> Optional[int]:
+    """
+    Get the fixed interval in seconds between runs of a simple cron expression.
+    
+    Covers every-N-minutes, every-N-hours, daily and weekly expressions (and
+    the matching @ macros) whose runs are evenly spaced; returns None for
+    anything else.
+    """
+    schedule = schedule.strip()
+    schedule = _MACROS.get(schedule.lower(), schedule)
+    match = _EVERY_N_MINUTES.match(schedule)
+    if match:
+        step = int(match.group(1) or 1)
+        return step * 60 if 0 < step <= 60 and 60 % step == 0 else None
+    match = _EVERY_N_HOURS.match(schedule)
+    if match:
+        step = int(match.group(2) or 1)
+        if int(match.group(1)) < 60 and 0 < step <= 24 and 24 % step == 0:
+            return step * 3600
+        return None
+    match = _DAILY.match(schedule)
+    if match and int(match.group(1)) < 60 and int(match.group(2)) < 24:
+        return 86400
+    match = _WEEKLY.match(schedule)
+    if match and int(match.group(1)) < 60 and int(match.group(2)) < 24:
+        return 7 * 86400
+    return None
+
+
+def _has_fixed_offset(dt: datetime) -> bool:
+    """Check whether a datetime's zone never shifts (no DST), so steps stay exact."""
+    try:
+        return dt.tzinfo is not None and dt.tzinfo.utcoffset(None) is not None
+    except Exception:
+        return False
 
 
 class ScheduledJob:
     """Base class for scheduled job execution."""
+    __slots__ = ('job', 'cancelled', 'command_extractor', 'executor')
     
     def __init__(self, job: Job):
         self.job = job
         self.cancelled = False
+        # Resolved once here rather than probing the task on every execution
+        self.command_extractor = _COMMAND_EXTRACTORS.get(job.task.type, _no_command)
+        # Set by the ScheduleManager when the job is scheduled
+        self.executor: Optional[TaskExecutor] = None
     
     def cancel(self):
         """Cancel this scheduled job."""
         self.cancelled = True
     
-    def should_run(self) -> bool:
-        """Check if the job should run now."""
+    def should_run(self, now_epoch: Optional[float] = None) -> bool:
+        """
+        Check if the job should run now.
+        
+        Args:
+            now_epoch: Current time as epoch seconds; read from the clock if omitted
+        """
+        raise NotImplementedError
+    
+    def next_fire_epoch(self) -> float:
+        """Get the time at which the job is next due, as epoch seconds."""
         raise NotImplementedError
     
     def mark_executed(self):
         """Mark the job as executed."""
         pass
+    
+    def post_execute(self, scheduler: Any):
+        """
+        Update the scheduler after this job has been dispatched.
+        
+        Called with the scheduler lock held.
+        
+        Args:
+            scheduler: The JobScheduler that dispatched the job
+        """
+        pass
 
 
 class OneTimeScheduledJob(ScheduledJob):
     """A job scheduled to run once at a specific time."""
+    __slots__ = ('schedule_time', 'schedule_epoch')
     
     def __init__(self, job: Job, schedule_time: datetime):
         super().__init__(job)
         self.schedule_time = schedule_time
+        self.schedule_epoch = schedule_time.timestamp()
     
-    def should_run(self) -> bool:
+    def should_run(self, now_epoch: Optional[float] = None) -> bool:
         """Check if the scheduled time has arrived."""
         if self.cancelled:
             return False
-        now = datetime.now(timezone.utc)
-        return now >= self.schedule_time
+        if now_epoch is None:
+            now_epoch = time.time()
+        return now_epoch >= self.schedule_epoch
+    
+    def next_fire_epoch(self) -> float:
+        """Get the scheduled time."""
+        return self.schedule_epoch
+    
+    def post_execute(self, scheduler: Any):
+        """Remove this job from the schedule unless it has been replaced."""
+        job_id = self.job.job_id
+        if scheduler.scheduled_jobs.get(job_id) is self:
+            del scheduler.scheduled_jobs[job_id]
+            logger.info("Removed one-time job: %s", job_id)
 
 
 class RecurringScheduledJob(ScheduledJob):
     """A job scheduled to run repeatedly based on a cron expression."""
+    __slots__ = ('cron', 'next_run_epoch', 'last_check_epoch', '_fast_step')
     
     def __init__(self, job: Job, cron: Any):
         super().__init__(job)
         self.cron = cron
-        self.next_run_time = cron.get_next(datetime)
-        self.last_check_time = datetime.now(timezone.utc)
+        # Scheduling math is done on epoch floats; datetimes are only built on demand
+        self.next_run_epoch: float = cron.get_next(float)
+        self.last_check_epoch: float = time.time()
+        # Evenly spaced schedules are advanced arithmetically instead of via croniter
+        step = _fast_step(job.schedule)
+        self._fast_step: Optional[float] = (
+            float(step) if step and _has_fixed_offset(self.next_run_time) else None
+        )
+    
+    @property
+    def next_run_time(self) -> datetime:
+        """The next run time as a datetime in the cron's timezone."""
+        return datetime.fromtimestamp(self.next_run_epoch, self.cron.tzinfo or timezone.utc)
+    
+    @property
+    def last_check_time(self) -> datetime:
+        """The time of the last execution (or of scheduling) as a UTC datetime."""
+        return datetime.fromtimestamp(self.last_check_epoch, timezone.utc)
     
-    def should_run(self) -> bool:
+    def should_run(self, now_epoch: Optional[float] = None) -> bool:
         """Check if it's time to run based on cron schedule."""
         if self.cancelled:
             return False
-        now = datetime.now(timezone.utc)
-        return now >= self.next_run_time
+        if now_epoch is None:
+            now_epoch = time.time()
+        return now_epoch >= self.next_run_epoch
+    
+    def next_fire_epoch(self) -> float:
+        """Get the next run time computed from the cron schedule."""
+        return self.next_run_epoch
     
     def mark_executed(self):
         """Update the last check time after execution."""
-        self.last_check_time = datetime.now(timezone.utc)
+        self.last_check_epoch = time.time()
     
     def reschedule(self):
         """Calculate the next run time."""
-        self.next_run_time = self.cron.get_next(datetime)
-
+        if self._fast_step is not None:
+            self.next_run_epoch += self._fast_step
+        else:
+            self.next_run_epoch = self.cron.get_next(float)
+    
+    def post_execute(self, scheduler: Any):
+        """Compute the next run and put the job back on the scheduler heap."""
+        self.reschedule()
+        if not self.cancelled:
+            scheduler._push(self)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Rescheduled job %s, next run: %s", self.job.job_id, self.next_run_time)
@@ -1,12 +1,15 @@
 """Core scheduler implementation."""
+import heapq
+import itertools
 import threading
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 from job_scheduler.models import Job
 from job_scheduler.logging import JobLogger, SchedulerLogger
-from .scheduled_job import ScheduledJob, OneTimeScheduledJob, RecurringScheduledJob
+from job_scheduler.utils.config import settings
+from .scheduled_job import ScheduledJob
 from .job_executor import JobExecutor
 from .schedule_manager import ScheduleManager
 
@@ -16,21 +19,38 @@ logger = logging.getLogger(__name__)
 class JobScheduler:
     """In-memory job scheduler supporting cron and one-time schedules."""
     
-    def __init__(self, log_directory: str = "logs"):
+    def __init__(self, log_directory: str = "logs", max_workers: Optional[int] = None,
+                 task_type_workers: Optional[Dict[str, int]] = None):
         """
         Initialize the job scheduler.
         
         Args:
             log_directory: Directory where job log files will be stored
+            max_workers: Maximum number of jobs executing concurrently
+                (default: settings.max_concurrent_jobs)
+            task_type_workers: Task type -> size of a dedicated worker pool
+                for that task type (default: settings.task_type_workers)
         """
+        if max_workers is None:
+            max_workers = settings.max_concurrent_jobs
+        if task_type_workers is None:
+            task_type_workers = settings.task_type_workers
         self.jobs: Dict[str, Job] = {}
         self.scheduled_jobs: Dict[str, ScheduledJob] = {}
         self.lock = threading.Lock()
+        # Min-heap of (fire_epoch, sequence, scheduled_job); cancelled entries
+        # are left in place and skipped when popped.
+        self._heap: List[Tuple[float, int, ScheduledJob]] = []
+        self._sequence = itertools.count()
+        self._cond = threading.Condition(self.lock)
         self.running = False
         self.scheduler_thread: Optional[threading.Thread] = None
         self.job_logger = JobLogger(log_directory)
         self.scheduler_logger = SchedulerLogger(log_directory)
-        self.job_executor = JobExecutor(self.job_logger, self.scheduler_logger)
+        self.job_executor = JobExecutor(
+            self.job_logger, self.scheduler_logger,
+            max_workers=max_workers, task_type_workers=task_type_workers
+        )
         self.schedule_manager = ScheduleManager(self.scheduler_logger)
     
     def add_job(self, job: Job):
@@ -40,24 +60,30 @@ class JobScheduler:
         Args:
             job: The job to add or update
         """
+        # Parse the schedule before taking the lock, unless the job is
+        # (most likely) an unchanged re-add that keeps its current schedule
+        scheduled_job = None
+        prebuilt = not self._keeps_schedule(job, self.jobs.get(job.job_id))
+        if prebuilt:
+            scheduled_job = self.schedule_manager.create_scheduled_job(job)
+        
         with self.lock:
-            is_new = job.job_id not in self.jobs
-            old_schedule = self.jobs.get(job.job_id, Job("", "", "", None)).schedule if job.job_id in self.jobs else ""
-            
+            existing = self.jobs.get(job.job_id)
             self.jobs[job.job_id] = job
-            self._schedule_job(job)
-            
-            # Log to scheduler.log
-            if is_new:
-                self.scheduler_logger.log_add(job.job_id, job.schedule)
-            else:
-                # Check if schedule changed
-                if old_schedule != job.schedule:
-                    self.scheduler_logger.log_schedule_change(job.job_id, old_schedule, job.schedule)
-                else:
-                    self.scheduler_logger.log_update(job.job_id, job.schedule)
-            
-            logger.info(f"Job added/updated: {job.job_id}")
+            if not self._keeps_schedule(job, existing):
+                if not prebuilt:
+                    scheduled_job = self.schedule_manager.create_scheduled_job(job)
+                self._schedule_job(job, scheduled_job)
+        
+        # Log to scheduler.log
+        if existing is None:
+            self.scheduler_logger.log_add(job.job_id, job.schedule)
+        elif existing.schedule != job.schedule:
+            self.scheduler_logger.log_schedule_change(job.job_id, existing.schedule, job.schedule)
+        else:
+            self.scheduler_logger.log_update(job.job_id, job.schedule)
+        
+        logger.info("Job added/updated: %s", job.job_id)
     
     def remove_job(self, job_id: str):
         """
@@ -67,27 +93,61 @@ class JobScheduler:
             job_id: The ID of the job to remove
         """
         with self.lock:
-            if job_id in self.jobs:
-                del self.jobs[job_id]
-            if job_id in self.scheduled_jobs:
-                self.scheduled_jobs[job_id].cancel()
-                del self.scheduled_jobs[job_id]
-            
-            # Log deletion to scheduler.log
-            self.scheduler_logger.log_delete(job_id)
-            
-            logger.info(f"Job removed: {job_id}")
+            self.jobs.pop(job_id, None)
+            scheduled_job = self.scheduled_jobs.pop(job_id, None)
+            if scheduled_job is not None:
+                scheduled_job.cancel()
+                self._cond.notify()
+        
+        # Log deletion to scheduler.log
+        self.scheduler_logger.log_delete(job_id)
+        
+        logger.info("Job removed: %s", job_id)
     
-    def _schedule_job(self, job: Job):
-        """Schedule a job for execution."""
+    def _keeps_schedule(self, job: Job, existing: Optional[Job]) -> bool:
+        """Check whether the job's current definition is identical and still scheduled."""
+        return existing == job and job.job_id in self.scheduled_jobs
+    
+    def _schedule_job(self, job: Job, scheduled_job: Optional[ScheduledJob]):
+        """Install a job's new schedule, replacing any existing one. Called with the lock held."""
         # Cancel existing scheduled job if updating
-        if job.job_id in self.scheduled_jobs:
-            self.scheduled_jobs[job.job_id].cancel()
+        previous = self.scheduled_jobs.pop(job.job_id, None)
+        if previous is not None:
+            previous.cancel()
         
-        # Create scheduled job using schedule manager
-        scheduled_job = self.schedule_manager.create_scheduled_job(job)
         if scheduled_job:
             self.scheduled_jobs[job.job_id] = scheduled_job
+            self._push(scheduled_job)
+    
+    def _push(self, scheduled_job: ScheduledJob):
+        """Queue a scheduled job on the heap and wake the scheduler loop."""
+        heapq.heappush(self._heap, (scheduled_job.next_fire_epoch(), next(self._sequence), scheduled_job))
+        self._cond.notify()
+    
+    def _recover(self, scheduled_job: ScheduledJob, now_epoch: float):
+        """
+        Keep a job whose post_execute failed consistent with the heap. Called with the lock held.
+        
+        The job goes back on the heap if it still has a future fire time.
+        Otherwise it is dropped from scheduled_jobs rather than left looking
+        scheduled, so re-adding the job schedules it again.
+        """
+        job_id = scheduled_job.job.job_id
+        if scheduled_job.cancelled or self.scheduled_jobs.get(job_id) is not scheduled_job:
+            return
+        if scheduled_job.next_fire_epoch() > now_epoch:
+            self._push(scheduled_job)
+        else:
+            del self.scheduled_jobs[job_id]
+    
+    def _pop_due_jobs(self, now_epoch: float) -> List[ScheduledJob]:
+        """Pop every live scheduled job whose fire time has been reached."""
+        due = []
+        while self._heap and self._heap[0][0] <= now_epoch:
+            _, _, scheduled_job = heapq.heappop(self._heap)
+            if not scheduled_job.cancelled:
+                due.append(scheduled_job)
+        return due
     
     def start(self):
         """Start the scheduler."""
@@ -103,45 +163,61 @@ class JobScheduler:
     
     def stop(self):
         """Stop the scheduler."""
-        self.running = False
+        with self._cond:
+            self.running = False
+            self._cond.notify()
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
+        self.job_executor.shutdown()
+        self.job_logger.flush()
         self.scheduler_logger.log_stop()
+        self.scheduler_logger.close()
         logger.info("Scheduler stopped")
     
     def _run(self):
         """Main scheduler loop."""
         while self.running:
             try:
-                with self.lock:
-                    jobs_to_run = []
-                    for scheduled_job in self.scheduled_jobs.values():
-                        if scheduled_job.should_run():
-                            jobs_to_run.append(scheduled_job)
+                with self._cond:
+                    now_epoch = time.time()
+                    jobs_to_run = self._pop_due_jobs(now_epoch)
+                    if not jobs_to_run:
+                        # Sleep until the earliest job is due or the heap changes
+                        timeout = self._heap[0][0] - now_epoch if self._heap else None
+                        if self.running and (timeout is None or timeout > 0):
+                            self._cond.wait(timeout=timeout)
+                        continue
                 
-                # Execute jobs that are due (outside the lock)
+                # Execute jobs that are due (outside the lock); a job removed
+                # since it was popped is skipped. A failed dispatch must not
+                # keep the job from being rescheduled below.
+                dispatched = []
+                errors = []
                 for scheduled_job in jobs_to_run:
-                    logger.debug(f"Executing job: {scheduled_job.job.job_id}")
-                    self.job_executor.execute(scheduled_job)
-                    scheduled_job.mark_executed()
-                    
-                    # Reschedule recurring jobs
-                    with self.lock:
-                        if isinstance(scheduled_job, RecurringScheduledJob):
-                            scheduled_job.reschedule()
-                            logger.debug(
-                                f"Rescheduled job {scheduled_job.job.job_id}, "
-                                f"next run: {scheduled_job.next_run_time}"
-                            )
-                        elif isinstance(scheduled_job, OneTimeScheduledJob):
-                            # Remove one-time jobs after execution
-                            if scheduled_job.job.job_id in self.scheduled_jobs:
-                                del self.scheduled_jobs[scheduled_job.job.job_id]
-                                logger.info(f"Removed one-time job: {scheduled_job.job.job_id}")
+                    if scheduled_job.cancelled:
+                        continue
+                    dispatched.append(scheduled_job)
+                    try:
+                        logger.debug("Executing job: %s", scheduled_job.job.job_id)
+                        self.job_executor.execute(scheduled_job)
+                        scheduled_job.mark_executed()
+                    except Exception as e:
+                        errors.append((scheduled_job.job.job_id, f"Failed to dispatch job: {e}"))
+                
+                # Reschedule recurring jobs, drop finished one-time jobs
+                with self.lock:
+                    for scheduled_job in dispatched:
+                        try:
+                            scheduled_job.post_execute(self)
+                        except Exception as e:
+                            errors.append((scheduled_job.job.job_id, f"Failed to reschedule job: {e}"))
+                            self._recover(scheduled_job, now_epoch)
+                
+                for job_id, error_msg in errors:
+                    logger.error("%s: %s", job_id, error_msg)
+                    self.scheduler_logger.log_error(job_id=job_id, error_msg=error_msg)
             
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {e}")
                 self.scheduler_logger.log_error(error_msg=str(e))
-            
-            time.sleep(1)  # Check every second
-
+                time.sleep(1)
@@ -1,5 +1,5 @@
 """Database components."""
-from .db_session import init_db, get_db, get_db_sync, engine, SessionLocal
+from .db_session import init_db, get_db, get_db_sync, engine, SessionLocal, ScopedSession
 from .persistence import JobPersistence, ExecutionPersistence, EventPersistence
 
 __all__ = [
@@ -8,6 +8,7 @@ __all__ = [
     'get_db_sync',
     'engine',
     'SessionLocal',
+    'ScopedSession',
     'JobPersistence',
     'ExecutionPersistence',
     'EventPersistence',
@@ -1,12 +1,24 @@
 """Database session management."""
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
 from sqlalchemy.pool import StaticPool
 
 from job_scheduler.utils.config import settings
 from job_scheduler.models.db_models import Base
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection for frequent small writes."""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+    finally:
+        cursor.close()
+
+
 def get_engine():
     """Get database engine."""
     database_url = settings.database_url
@@ -19,6 +31,7 @@ def get_engine():
             poolclass=StaticPool,
             echo=False
         )
+        event.listen(engine, "connect", _set_sqlite_pragmas)
     else:
         pool_size = getattr(settings, 'database_pool_size', 10)
         engine = create_engine(
@@ -32,6 +45,8 @@ def get_engine():
 
 engine = get_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Thread-local session registry, reused across persistence calls
+ScopedSession = scoped_session(SessionLocal)
 
 
 def init_db():
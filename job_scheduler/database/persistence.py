@@ -1,11 +1,101 @@
 """Database persistence layer for jobs and executions."""
-import json
+import logging
+import queue
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy import select
+from sqlalchemy.engine import Result
 from sqlalchemy.orm import Session
 
 from job_scheduler.models import JobModel, JobExecutionModel, SchedulerEventModel, Job, Task
-from .db_session import get_db_sync
+from job_scheduler.utils.json_codec import dumps, loads
+from .db_session import ScopedSession
+
+logger = logging.getLogger(__name__)
+
+
+class _BatchWriter:
+    """Persists queued rows for one model from a background thread, in batches."""
+    
+    def __init__(self, model: Any, batch_size: int = 128, flush_interval: float = 0.2):
+        """
+        Initialize the batch writer.
+        
+        Args:
+            model: The SQLAlchemy model the queued rows belong to
+            batch_size: Maximum number of rows committed together
+            flush_interval: Seconds to wait for a batch to fill up
+        """
+        self.model = model
+        # Core INSERT compiled once; batches go through executemany
+        self._insert = model.__table__.insert()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def put(self, row: Dict[str, Any]) -> None:
+        """Queue a row for insertion, starting the writer thread if needed."""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name=f"{self.model.__tablename__}-writer", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put(row)
+    
+    def flush(self) -> None:
+        """Block until every queued row has been written."""
+        self._queue.join()
+    
+    def _run(self) -> None:
+        """Writer loop: collect up to batch_size rows or flush_interval seconds."""
+        while True:
+            batch: List[Dict[str, Any]] = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert a batch of rows with one executemany and a single commit."""
+        # The writer thread keeps its thread-local session for its lifetime
+        db = ScopedSession()
+        try:
+            with db.begin():
+                db.execute(self._insert, batch)
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error("Failed to write row to %s: %s", self.model.__tablename__, e)
+                return
+            logger.warning("Failed to write %d rows to %s, retrying one by one: %s",
+                           len(batch), self.model.__tablename__, e)
+        # A single bad row fails the whole executemany; only that row should be lost
+        for row in batch:
+            try:
+                with db.begin():
+                    db.execute(self._insert, row)
+            except Exception as e:
+                logger.error("Failed to write row to %s: %s", self.model.__tablename__, e)
+
+
+_execution_writer = _BatchWriter(JobExecutionModel)
+_event_writer = _BatchWriter(SchedulerEventModel)
 
 
 class JobPersistence:
@@ -14,17 +104,18 @@ class JobPersistence:
     @staticmethod
     def save_job(job: Job) -> None:
         """Save or update a job in the database."""
-        db = get_db_sync()
-        try:
+        db = ScopedSession()
+        with db.begin():
             # Convert task to JSON
-            task_config = json.dumps({
-                "type": job.task.type,
-                **{k: v for k, v in job.task.__dict__.items() if k != "type"}
-            })
+            task_config = dumps(job.task.to_dict())
             
             db_job = db.query(JobModel).filter(JobModel.job_id == job.job_id).first()
             
             if db_job:
+                stored = (db_job.description, db_job.schedule, db_job.task_type, db_job.task_config)
+                if stored == (job.description, job.schedule, job.task.type, task_config):
+                    # Unchanged (e.g. a job file re-read as-is); skip the UPDATE
+                    return
                 # Update existing job
                 db_job.description = job.description
                 db_job.schedule = job.schedule
@@ -42,25 +133,18 @@ class JobPersistence:
                     enabled=True
                 )
                 db.add(db_job)
-            
-            db.commit()
-        except Exception as e:
-            db.rollback()
-            raise
-        finally:
-            db.close()
     
     @staticmethod
     def load_job(job_id: str) -> Optional[Job]:
         """Load a job from the database."""
-        db = get_db_sync()
-        try:
+        db = ScopedSession()
+        with db.begin():
             db_job = db.query(JobModel).filter(JobModel.job_id == job_id).first()
             if not db_job or not db_job.enabled:
                 return None
             
             # Reconstruct task from JSON
-            task_data = json.loads(db_job.task_config)
+            task_data = loads(db_job.task_config)
             task = Task.from_dict(task_data)
             
             return Job(
@@ -69,66 +153,52 @@ class JobPersistence:
                 schedule=db_job.schedule,
                 task=task
             )
-        finally:
-            db.close()
     
     @staticmethod
     def load_all_jobs() -> List[Job]:
         """Load all enabled jobs from the database."""
-        db = get_db_sync()
-        try:
-            db_jobs = db.query(JobModel).filter(JobModel.enabled == True).all()
+        db = ScopedSession()
+        with db.begin():
+            # Select plain column tuples and stream them, skipping ORM hydration
+            rows: Result[Tuple[str, Optional[str], str, str]] = db.execute(
+                select(JobModel.job_id, JobModel.description, JobModel.schedule, JobModel.task_config)
+                .where(JobModel.enabled.is_(True))
+                .execution_options(yield_per=500)
+            )
             jobs = []
             
-            for db_job in db_jobs:
+            for job_id, description, schedule, task_config in rows:
                 try:
-                    task_data = json.loads(db_job.task_config)
-                    task = Task.from_dict(task_data)
                     jobs.append(Job(
-                        job_id=db_job.job_id,
-                        description=db_job.description,
-                        schedule=db_job.schedule,
-                        task=task
+                        job_id=job_id,
+                        description=description,
+                        schedule=schedule,
+                        task=Task.from_dict(loads(task_config))
                     ))
                 except Exception as e:
                     # Skip jobs with invalid task configs
-                    import logging
-                    logging.getLogger(__name__).error(f"Failed to load job {db_job.job_id}: {e}")
+                    logger.error(f"Failed to load job {job_id}: {e}")
             
             return jobs
-        finally:
-            db.close()
     
     @staticmethod
     def delete_job(job_id: str) -> None:
         """Delete a job from the database."""
-        db = get_db_sync()
-        try:
+        db = ScopedSession()
+        with db.begin():
             db_job = db.query(JobModel).filter(JobModel.job_id == job_id).first()
             if db_job:
                 db.delete(db_job)
-                db.commit()
-        except Exception as e:
-            db.rollback()
-            raise
-        finally:
-            db.close()
     
     @staticmethod
     def disable_job(job_id: str) -> None:
         """Disable a job without deleting it."""
-        db = get_db_sync()
-        try:
+        db = ScopedSession()
+        with db.begin():
             db_job = db.query(JobModel).filter(JobModel.job_id == job_id).first()
             if db_job:
                 db_job.enabled = False
                 db_job.updated_at = datetime.now(timezone.utc)
-                db.commit()
-        except Exception as e:
-            db.rollback()
-            raise
-        finally:
-            db.close()
 
 
 class ExecutionPersistence:
@@ -148,29 +218,25 @@ class ExecutionPersistence:
         error_message: Optional[str] = None,
         retry_count: int = 0
     ) -> None:
-        """Save a job execution to the database."""
-        db = get_db_sync()
-        try:
-            execution = JobExecutionModel(
-                execution_id=execution_id,
-                job_id=job_id,
-                start_time=start_time,
-                end_time=end_time,
-                duration_seconds=duration_seconds,
-                status=status,
-                exit_code=exit_code,
-                stdout=stdout[:10000] if stdout else None,  # Limit size
-                stderr=stderr[:10000] if stderr else None,  # Limit size
-                error_message=error_message[:1000] if error_message else None,
-                retry_count=retry_count
-            )
-            db.add(execution)
-            db.commit()
-        except Exception as e:
-            db.rollback()
-            raise
-        finally:
-            db.close()
+        """Queue a job execution to be saved to the database in the next batch."""
+        _execution_writer.put(dict(
+            execution_id=execution_id,
+            job_id=job_id,
+            start_time=start_time,
+            end_time=end_time,
+            duration_seconds=duration_seconds,
+            status=status,
+            exit_code=exit_code,
+            stdout=stdout[:10000] if stdout else None,  # Limit size
+            stderr=stderr[:10000] if stderr else None,  # Limit size
+            error_message=error_message[:1000] if error_message else None,
+            retry_count=retry_count
+        ))
+    
+    @staticmethod
+    def flush() -> None:
+        """Block until all queued executions have been written."""
+        _execution_writer.flush()
     
     @staticmethod
     def get_executions(
@@ -179,8 +245,8 @@ class ExecutionPersistence:
         status: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get job executions from the database."""
-        db = get_db_sync()
-        try:
+        db = ScopedSession()
+        with db.begin():
             query = db.query(JobExecutionModel)
             
             if job_id:
@@ -203,8 +269,6 @@ class ExecutionPersistence:
                 }
                 for e in executions
             ]
-        finally:
-            db.close()
 
 
 class EventPersistence:
@@ -218,21 +282,17 @@ class EventPersistence:
         new_schedule: Optional[str] = None,
         error_message: Optional[str] = None
     ) -> None:
-        """Save a scheduler event to the database."""
-        db = get_db_sync()
-        try:
-            event = SchedulerEventModel(
-                event_type=event_type,
-                job_id=job_id,
-                old_schedule=old_schedule,
-                new_schedule=new_schedule,
-                error_message=error_message[:1000] if error_message else None
-            )
-            db.add(event)
-            db.commit()
-        except Exception as e:
-            db.rollback()
-            raise
-        finally:
-            db.close()
-
+        """Queue a scheduler event to be saved to the database in the next batch."""
+        _event_writer.put(dict(
+            event_type=event_type,
+            job_id=job_id,
+            old_schedule=old_schedule,
+            new_schedule=new_schedule,
+            error_message=error_message[:1000] if error_message else None,
+            timestamp=datetime.now(timezone.utc)
+        ))
+    
+    @staticmethod
+    def flush() -> None:
+        """Block until all queued events have been written."""
+        _event_writer.flush()
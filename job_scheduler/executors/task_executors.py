@@ -1,7 +1,9 @@
 """Task executor implementations - extensible design."""
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Tuple
+import os
 import subprocess
+import tempfile
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,7 +27,15 @@ class TaskExecutor(ABC):
 
 
 class ExecuteCommandExecutor(TaskExecutor):
-    """Executor for execute_command tasks."""
+    """Executor for execute_command tasks.
+    
+    The command's stdout and stderr go to anonymous temporary files, not
+    in-memory pipes, so a chatty command cannot grow the scheduler's memory.
+    Only the last ``MAX_OUTPUT_BYTES`` of each stream are read back.
+    """
+    
+    TIMEOUT_SECONDS = 3600  # 1 hour timeout
+    MAX_OUTPUT_BYTES = 64 * 1024
     
     def execute(self, task: Any) -> Tuple[bool, str, str, int]:
         """
@@ -38,29 +48,35 @@ class ExecuteCommandExecutor(TaskExecutor):
             tuple: (success: bool, output: str, error: str, exit_code: int)
         """
         try:
-            logger.info(f"Executing command: {task.command}")
-            result = subprocess.run(
-                task.command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=3600  # 1 hour timeout
-            )
-            
-            exit_code = result.returncode
-            stdout = result.stdout or ""
-            stderr = result.stderr or ""
+            logger.info("Executing command: %s", task.command)
+            with tempfile.TemporaryFile() as out_file, tempfile.TemporaryFile() as err_file:
+                # An argv list is spawned directly, skipping the /bin/sh process
+                argv = getattr(task, 'argv', None)
+                process = subprocess.Popen(
+                    argv or task.command,
+                    shell=not argv,
+                    stdout=out_file,
+                    stderr=err_file,
+                )
+                try:
+                    exit_code = process.wait(timeout=self.TIMEOUT_SECONDS)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                    raise
+                stdout = self._read_tail(out_file)
+                stderr = self._read_tail(err_file)
             
             if exit_code == 0:
-                logger.info(f"Command succeeded: {task.command}")
+                logger.info("Command succeeded: %s", task.command)
                 if stdout:
-                    logger.debug(f"Command output: {stdout}")
+                    logger.debug("Command output: %s", stdout)
                 return True, stdout, "", exit_code
             else:
                 error_msg = f"Command failed with exit code {exit_code}"
-                logger.error(f"{error_msg}: {task.command}")
+                logger.error("%s: %s", error_msg, task.command)
                 if stderr:
-                    logger.error(f"Command error: {stderr}")
+                    logger.error("Command error: %s", stderr)
                 return False, stdout, stderr, exit_code
                 
         except subprocess.TimeoutExpired:
@@ -71,6 +87,20 @@ class ExecuteCommandExecutor(TaskExecutor):
             error_msg = f"Error executing command: {str(e)}"
             logger.error(f"{error_msg}: {task.command}")
             return False, "", error_msg, -1
+    
+    def _read_tail(self, file) -> str:
+        """
+        Read the last ``MAX_OUTPUT_BYTES`` written to a captured stream.
+        
+        Args:
+            file: Binary temporary file the child process wrote to
+            
+        Returns:
+            str: Decoded tail of the stream (empty if nothing was written)
+        """
+        size = file.seek(0, os.SEEK_END)
+        file.seek(max(0, size - self.MAX_OUTPUT_BYTES))
+        return file.read().decode('utf-8', errors='replace')
 
 
 class TaskExecutorFactory:
@@ -1,10 +1,11 @@
 """Job-specific logging functionality."""
 import logging
 import os
+import queue
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime, timezone
-from uuid import uuid4
 
 
 class JobLogger:
@@ -25,6 +26,36 @@ class JobLogger:
         import logging as std_logging
         std_logger = std_logging.getLogger(__name__)
         std_logger.info(f"JobLogger initialized with log directory: {self.log_directory}")
+        
+        # Execution records are written behind the caller by a single thread
+        self._queue: "queue.Queue[Tuple[Any, ...]]" = queue.Queue(maxsize=10000)
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        # Per-job directories known to exist, so they are not re-created per execution
+        self._job_dirs: Dict[str, str] = {}
+    
+    def flush(self):
+        """Block until every queued execution record has been written."""
+        self._queue.join()
+    
+    def _ensure_writer(self):
+        """Start the writer thread on first use."""
+        if self._writer_thread is None:
+            with self._writer_lock:
+                if self._writer_thread is None:
+                    self._writer_thread = threading.Thread(
+                        target=self._run_writer, name="job-log-writer", daemon=True
+                    )
+                    self._writer_thread.start()
+    
+    def _run_writer(self):
+        """Writer loop: write queued records in arrival order."""
+        while True:
+            record = self._queue.get()
+            try:
+                self._write_execution(*record)
+            finally:
+                self._queue.task_done()
     
     def log_execution(self, job_id: str, execution_id: str, start_time: datetime, 
                      end_time: datetime, duration_seconds: float, status: str,
@@ -32,9 +63,12 @@ class JobLogger:
         """
         Log a job execution to logs/<job_id>/<execution_id>.log
         
+        The record is queued and written by a background thread; if the queue
+        is full it is written synchronously instead.
+        
         Args:
             job_id: The job ID
-            execution_id: Unique execution ID (uuid4().hex)
+            execution_id: Unique execution ID
             start_time: When execution started (ISO8601 UTC)
             end_time: When execution ended (ISO8601 UTC)
             duration_seconds: Execution duration in seconds
@@ -44,32 +78,62 @@ class JobLogger:
             stdout: Standard output
             stderr: Standard error
         """
+        record = (job_id, execution_id, start_time, end_time, duration_seconds,
+                  status, command, exit_code, stdout, stderr)
+        self._ensure_writer()
         try:
-            # Create job-specific directory
-            job_log_dir = self.log_directory / job_id
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self._write_execution(*record)
+    
+    def _job_log_path(self, job_id: str, execution_id: str) -> str:
+        """Get the log file path for an execution, creating the job directory once."""
+        job_log_dir = self._job_dirs.get(job_id)
+        if job_log_dir is None:
+            job_log_dir = os.path.join(self.log_directory, job_id)
             os.makedirs(job_log_dir, exist_ok=True)
+            self._job_dirs[job_id] = job_log_dir
+        return os.path.join(job_log_dir, f"{execution_id}.log")
+    
+    def _write_execution(self, job_id: str, execution_id: str, start_time: datetime,
+                         end_time: datetime, duration_seconds: float, status: str,
+                         command: str, exit_code: int, stdout: str, stderr: str):
+        """Write one execution record to logs/<job_id>/<execution_id>.log"""
+        try:
+            # Assemble the whole record with the required format, then write it at once
+            parts = [
+                f"execution_id: {execution_id}\n",
+                f"job_id: {job_id}\n",
+                f"command: {command}\n",
+                f"start_time: {start_time.isoformat()}\n",
+                f"end_time: {end_time.isoformat()}\n",
+                f"duration_seconds: {duration_seconds}\n",
+                f"status: {status}\n",
+                f"exit_code: {exit_code}\n",
+                "stdout:\n",
+                stdout,
+            ]
+            if stdout and not stdout.endswith('\n'):
+                parts.append('\n')
+            parts.append("stderr:\n")
+            parts.append(stderr)
+            if stderr and not stderr.endswith('\n'):
+                parts.append('\n')
+            payload = memoryview("".join(parts).encode('utf-8'))
             
-            # Create execution log file
-            log_file = job_log_dir / f"{execution_id}.log"
-            
-            # Write execution log with required format
-            with open(log_file, 'w', encoding='utf-8') as f:
-                f.write(f"execution_id: {execution_id}\n")
-                f.write(f"job_id: {job_id}\n")
-                f.write(f"command: {command}\n")
-                f.write(f"start_time: {start_time.isoformat()}\n")
-                f.write(f"end_time: {end_time.isoformat()}\n")
-                f.write(f"duration_seconds: {duration_seconds}\n")
-                f.write(f"status: {status}\n")
-                f.write(f"exit_code: {exit_code}\n")
-                f.write("stdout:\n")
-                f.write(stdout)
-                if stdout and not stdout.endswith('\n'):
-                    f.write('\n')
-                f.write("stderr:\n")
-                f.write(stderr)
-                if stderr and not stderr.endswith('\n'):
-                    f.write('\n')
+            # Create execution log file in the job-specific directory
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            try:
+                fd = os.open(self._job_log_path(job_id, execution_id), flags, 0o644)
+            except FileNotFoundError:
+                # Directory removed since it was cached (e.g. log cleanup)
+                self._job_dirs.pop(job_id, None)
+                fd = os.open(self._job_log_path(job_id, execution_id), flags, 0o644)
+            try:
+                while payload:
+                    payload = payload[os.write(fd, payload):]
+            finally:
+                os.close(fd)
             
         except Exception as e:
             # Fallback to main logger if job logger fails
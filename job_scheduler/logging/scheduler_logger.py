@@ -1,7 +1,9 @@
 """Scheduler-level logging to logs/scheduler.log"""
 import os
+import threading
+import time
 from pathlib import Path
-from datetime import datetime, timezone
+from typing import Optional, Tuple
 
 
 class SchedulerLogger:
@@ -18,6 +20,28 @@ class SchedulerLogger:
         self.log_file = self.log_directory / "scheduler.log"
         # Ensure directory exists
         os.makedirs(self.log_directory, exist_ok=True)
+        # O_APPEND descriptor kept open across events: one write per line, and
+        # lines from other processes appending to the same file never interleave
+        self._fd: Optional[int] = None
+        self._fd_lock = threading.Lock()
+        # (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp
+        self._second_cache: Tuple[int, str] = (-1, "")
+    
+    def close(self):
+        """Close the log file; the next event reopens it."""
+        with self._fd_lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+    
+    def _timestamp(self) -> str:
+        """Format the current UTC time as ISO 8601 with microseconds."""
+        seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+        cached_second, prefix = self._second_cache
+        if cached_second != seconds:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+            self._second_cache = (seconds, prefix)
+        return f"{prefix}.{nanos // 1000:06d}+00:00"
     
     def _write_log(self, event_type: str, job_id: str = "", old_schedule: str = "", new_schedule: str = "", error_msg: str = ""):
         """
@@ -25,9 +49,7 @@ class SchedulerLogger:
         
         Format: [UTC_TIMESTAMP] EVENT_TYPE job_id=<id> old_schedule=<..> new_schedule=<..>
         """
-        timestamp = datetime.now(timezone.utc).isoformat()
-        
-        parts = [f"[{timestamp}]", event_type]
+        parts = [f"[{self._timestamp()}]", event_type]
         
         if job_id:
             parts.append(f"job_id={job_id}")
@@ -38,11 +60,14 @@ class SchedulerLogger:
         if error_msg:
             parts.append(f"error={error_msg}")
         
-        log_line = " ".join(parts) + "\n"
+        log_line = (" ".join(parts) + "\n").encode("utf-8")
         
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(log_line)
+            with self._fd_lock:
+                if self._fd is None:
+                    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+                    self._fd = os.open(self.log_file, flags, 0o644)
+                os.write(self._fd, log_line)
         except Exception as e:
             # Fallback to stderr if logging fails
             import sys
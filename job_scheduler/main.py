@@ -1,7 +1,7 @@
 """Main entry point for the job scheduler service."""
 import argparse
 import signal
-import sys
+import threading
 import logging
 from pathlib import Path
 
@@ -42,6 +42,11 @@ def main():
         default='logs',
         help='Directory for job-specific log files (default: logs)'
     )
+    parser.add_argument(
+        '--polling',
+        action='store_true',
+        help='Poll the jobs directory instead of using filesystem notifications (e.g. for NFS/CIFS)'
+    )
     
     args = parser.parse_args()
     
@@ -50,14 +55,14 @@ def main():
     
     # Create scheduler and file watcher
     scheduler = JobScheduler(log_directory=args.log_dir)
-    file_watcher = JobFileWatcher(args.jobs_dir, scheduler)
+    file_watcher = JobFileWatcher(args.jobs_dir, scheduler, use_polling=args.polling)
+    
+    # Setup signal handlers for graceful shutdown; cleanup runs in the finally below
+    shutdown_event = threading.Event()
     
-    # Setup signal handlers for graceful shutdown
     def signal_handler(sig, frame):
         logger.info("Shutdown signal received, stopping scheduler...")
-        file_watcher.stop()
-        scheduler.stop()
-        sys.exit(0)
+        shutdown_event.set()
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -69,10 +74,8 @@ def main():
         
         logger.info("Job Scheduler is running. Press Ctrl+C to stop.")
         
-        # Keep the main thread alive
-        while True:
-            import time
-            time.sleep(1)
+        # Keep the main thread alive until a shutdown signal arrives
+        shutdown_event.wait()
     
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
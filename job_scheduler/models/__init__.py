@@ -1,11 +1,12 @@
 """Data models for jobs and database."""
-from .job_models import Job, Task, ExecuteCommandTask
+from .job_models import Job, Task, ExecuteCommandTask, register_task
 from .db_models import JobModel, JobExecutionModel, SchedulerEventModel
 
 __all__ = [
     'Job',
     'Task',
     'ExecuteCommandTask',
+    'register_task',
     'JobModel',
     'JobExecutionModel',
     'SchedulerEventModel',
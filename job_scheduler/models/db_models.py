@@ -1,6 +1,6 @@
 """Database models for job persistence."""
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -27,6 +27,10 @@ class JobModel(Base):
 class JobExecutionModel(Base):
     """Database model for job executions."""
     __tablename__ = "job_executions"
+    __table_args__ = (
+        # "Latest executions of job X"
+        Index("ix_jobexec_job_start", "job_id", "start_time"),
+    )
     
     execution_id = Column(String, primary_key=True, index=True)
     job_id = Column(String, ForeignKey("jobs.job_id"), nullable=False, index=True)
@@ -47,6 +51,10 @@ class JobExecutionModel(Base):
 class SchedulerEventModel(Base):
     """Database model for scheduler events."""
     __tablename__ = "scheduler_events"
+    __table_args__ = (
+        # Event-type-scoped timelines
+        Index("ix_sched_events_type_ts", "event_type", "timestamp"),
+    )
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     event_type = Column(String, nullable=False, index=True)  # ADD, UPDATE, DELETE, START, STOP, ERROR
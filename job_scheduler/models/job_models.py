@@ -1,52 +1,126 @@
 """Job and Task models for the scheduler."""
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Dict, Any, Optional
-import json
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+import shlex
+import sys
+
+from job_scheduler.utils.json_codec import loads
+
+
+# Task type string -> Task subclass, consulted by Task.from_dict
+_TASK_TYPES: Dict[str, Type["Task"]] = {}
+
+T = TypeVar("T", bound="Task")
+
+
+def register_task(task_type: str) -> Callable[[Type[T]], Type[T]]:
+    """
+    Class decorator registering a Task subclass for a task type.
+    
+    Args:
+        task_type: The "type" value in job files handled by the class
+    """
+    def decorator(task_class: Type[T]) -> Type[T]:
+        _TASK_TYPES[task_type] = task_class
+        return task_class
+    return decorator
 
 
 @dataclass
 class Task:
     """Base task class - extensible for different task types."""
+    __slots__ = ('type',)
+    
     type: str
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the task to a dictionary (the inverse of from_dict)."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Task':
         """Factory method to create task instances from JSON."""
         task_type = data.get('type')
-        if task_type == 'execute_command':
-            return ExecuteCommandTask.from_dict(data)
-        else:
+        task_class = _TASK_TYPES.get(task_type) if isinstance(task_type, str) else None
+        if task_class is None:
             raise ValueError(f"Unknown task type: {task_type}")
+        return task_class.from_dict(data)
 
 
+@register_task('execute_command')
 @dataclass
 class ExecuteCommandTask(Task):
-    """Task that executes a shell command."""
+    """Task that executes a shell command.
+    
+    When ``argv`` is given the program is executed directly, without a
+    ``/bin/sh -c`` wrapper, and ``command`` is only used for logging.
+    """
+    __slots__ = ('command', 'argv')
+    
     command: str
+    argv: Optional[List[str]]
     
-    def __init__(self, command: str):
+    def __init__(self, command: str, argv: Optional[List[str]] = None):
         super().__init__(type='execute_command')
         self.command = command
+        self.argv = argv
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the task to a dictionary, omitting argv when unset."""
+        data: Dict[str, Any] = {'type': self.type, 'command': self.command}
+        if self.argv is not None:
+            data['argv'] = self.argv
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ExecuteCommandTask':
         if data.get('type') != 'execute_command':
             raise ValueError("Invalid task type for ExecuteCommandTask")
-        command = data.get('command')
+        argv = data.get('argv')
+        if argv is not None:
+            if not isinstance(argv, list) or not argv or not all(isinstance(a, str) for a in argv):
+                raise ValueError("argv must be a non-empty list of strings")
+        command = data.get('command') or (shlex.join(argv) if argv else None)
         if not command:
             raise ValueError("Command is required for execute_command task")
-        return cls(command=command)
+        return cls(command=command, argv=argv)
+
+
+def _schedule_str(schedule: Any) -> str:
+    """Return a schedule as a string, accepting epoch seconds given as a JSON number."""
+    if isinstance(schedule, str):
+        return schedule
+    if isinstance(schedule, float) and schedule.is_integer():
+        schedule = int(schedule)
+    if isinstance(schedule, int) and not isinstance(schedule, bool):
+        return str(schedule)
+    raise ValueError("schedule must be a string or whole epoch seconds")
 
 
 @dataclass
 class Job:
     """Job definition with schedule and task."""
+    __slots__ = ('job_id', 'description', 'schedule', 'task', '_is_cron')
+    
     job_id: str
     description: str
-    schedule: str  # Can be cron string or ISO 8601 timestamp
+    schedule: str  # Can be cron string, ISO 8601 timestamp or epoch seconds
     task: Task
     
+    def __post_init__(self):
+        # Interned so the scheduler's job_id-keyed dicts match re-loaded jobs by identity
+        if isinstance(self.job_id, str):
+            self.job_id = sys.intern(self.job_id)
+        # Derived once (slot, not a field), since scheduling decisions consult it repeatedly.
+        # Simple heuristic: cron strings don't contain 'T' or 'Z', and are never
+        # a bare number (which is taken as epoch seconds)
+        self.schedule = schedule = _schedule_str(self.schedule)
+        self._is_cron = (
+            'T' not in schedule and 'Z' not in schedule
+            and not (schedule.isascii() and schedule.isdigit())
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Job':
         """Create a Job instance from a dictionary (parsed JSON)."""
@@ -75,16 +149,16 @@ class Job:
     @classmethod
     def from_json_file(cls, file_path: str) -> 'Job':
         """Load a job from a JSON file."""
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = loads(raw)
         return cls.from_dict(data)
     
     def is_cron_schedule(self) -> bool:
         """Check if schedule is a cron string (not ISO 8601 timestamp)."""
-        # Simple heuristic: cron strings don't contain 'T' or 'Z'
-        return 'T' not in self.schedule and 'Z' not in self.schedule
+        return self._is_cron
     
     def is_one_time_schedule(self) -> bool:
-        """Check if schedule is a one-time ISO 8601 timestamp."""
-        return not self.is_cron_schedule()
+        """Check if schedule is a one-time ISO 8601 timestamp or epoch seconds."""
+        return not self._is_cron
 
@@ -1,10 +1,14 @@
 """Configuration management for production deployment."""
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field, validator
 
+# Accepted log levels, in the order they are listed in error messages
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(LOG_LEVELS)
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
@@ -51,6 +55,11 @@ class Settings(BaseSettings):
         env="MAX_CONCURRENT_JOBS",
         description="Maximum concurrent job executions"
     )
+    # Read from TASK_TYPE_WORKERS through the field name
+    task_type_workers: Dict[str, int] = Field(
+        default_factory=dict,
+        description='Dedicated worker pool sizes per task type, as JSON (e.g. {"execute_command": 10})'
+    )
     job_timeout: int = Field(
         default=3600,
         env="JOB_TIMEOUT",
@@ -83,10 +92,18 @@ class Settings(BaseSettings):
     @validator("log_level")
     def validate_log_level(cls, v):
         """Validate log level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"Log level must be one of {valid_levels}")
-        return v.upper()
+        level = v.upper()
+        if level not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Log level must be one of {list(LOG_LEVELS)}")
+        return level
+    
+    @validator("task_type_workers")
+    def validate_task_type_workers(cls, v):
+        """Ensure dedicated worker pools have at least one worker."""
+        for task_type, workers in v.items():
+            if workers < 1:
+                raise ValueError(f"Worker pool size for {task_type} must be at least 1")
+        return v
     
     @validator("database_url")
     def validate_database_url(cls, v):
@@ -0,0 +1,25 @@
+"""JSON encoding and decoding, using orjson when it is installed."""
+import json
+from types import ModuleType
+from typing import Any, Dict, Optional, Union
+
+# Optional faster JSON codec
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data: Dict[str, Any]) -> str:
+    """Serialize to compact JSON; the stdlib fallback matches orjson's output."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON text or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
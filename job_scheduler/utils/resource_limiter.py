@@ -11,14 +11,18 @@ logger = logging.getLogger(__name__)
 
 
 class ResourceLimiter:
-    """Manages resource limits for job execution."""
+    """Manages resource limits for job execution.
+    
+    The semaphore is the only synchronisation: single dict operations are
+    atomic under the GIL, and ``release`` only returns a permit when its
+    ``pop`` actually removed the job, so a double release is harmless.
+    """
     
     def __init__(self):
         """Initialize resource limiter."""
         self.max_concurrent = settings.max_concurrent_jobs
         self.active_jobs = {}  # job_id -> execution_id
-        self.lock = threading.Lock()
-        self.semaphore = threading.Semaphore(self.max_concurrent)
+        self.semaphore = threading.BoundedSemaphore(self.max_concurrent)
     
     def acquire(self, job_id: str, execution_id: str) -> bool:
         """
@@ -33,16 +37,15 @@ class ResourceLimiter:
         """
         acquired = self.semaphore.acquire(blocking=False)
         if acquired:
-            with self.lock:
-                self.active_jobs[job_id] = execution_id
-                logger.debug(
-                    f"Acquired resources for job {job_id} "
-                    f"(active: {len(self.active_jobs)}/{self.max_concurrent})"
-                )
+            self.active_jobs[job_id] = execution_id
+            logger.debug(
+                "Acquired resources for job %s (active: %d/%d)",
+                job_id, len(self.active_jobs), self.max_concurrent
+            )
         else:
             logger.warning(
-                f"Resource limit reached: {len(self.active_jobs)}/{self.max_concurrent} "
-                f"jobs running. Job {job_id} queued."
+                "Resource limit reached: %d/%d jobs running. Job %s queued.",
+                len(self.active_jobs), self.max_concurrent, job_id
             )
         return acquired
     
@@ -53,22 +56,17 @@ class ResourceLimiter:
         Args:
             job_id: Job ID
         """
-        with self.lock:
-            if job_id in self.active_jobs:
-                del self.active_jobs[job_id]
-                self.semaphore.release()
-                logger.debug(
-                    f"Released resources for job {job_id} "
-                    f"(active: {len(self.active_jobs)}/{self.max_concurrent})"
-                )
+        if self.active_jobs.pop(job_id, None) is not None:
+            self.semaphore.release()
+            logger.debug(
+                "Released resources for job %s (active: %d/%d)",
+                job_id, len(self.active_jobs), self.max_concurrent
+            )
     
     def get_active_count(self) -> int:
         """Get the number of currently active jobs."""
-        with self.lock:
-            return len(self.active_jobs)
+        return len(self.active_jobs)
     
     def get_active_jobs(self) -> dict:
         """Get a copy of active jobs."""
-        with self.lock:
-            return self.active_jobs.copy()
-
+        return self.active_jobs.copy()
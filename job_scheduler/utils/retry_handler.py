@@ -1,25 +1,44 @@
 """Retry mechanism for failed job executions."""
+import heapq
+import itertools
 import time
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from threading import Lock
 
 from .config import settings
-from job_scheduler.models import Job
 from job_scheduler.executors import TaskExecutorFactory
 
+if TYPE_CHECKING:
+    # Runtime import would be circular: the models import utils.json_codec
+    from job_scheduler.models import Job
+
 logger = logging.getLogger(__name__)
 
 
 class RetryHandler:
-    """Handles retry logic for failed job executions."""
+    """Handles retry logic for failed job executions.
+    
+    Pending retries sit in a min-heap keyed on the monotonic time at which
+    their exponential backoff expires, so collecting due retries only
+    touches the due entries. Clearing a job's retries bumps its generation;
+    stale heap entries are dropped when they reach the top, and a job's
+    generation is forgotten once none of its entries remain.
+    """
+    
+    MAX_RETRY_DELAY = 3600  # Cap backoff at 1 hour
     
     def __init__(self):
         """Initialize retry handler."""
         self.max_retries = settings.max_retries
         self.retry_delay = settings.retry_delay
-        self.retry_queue = []  # List of (job, execution_id, retry_count, error) tuples
+        # Heap of (ready_at_ns, seq, generation, job, execution_id, retry_count, error)
+        self._heap: List[tuple] = []
+        self._generations: Dict[str, int] = {}
+        # Heap entries per job id, stale ones included
+        self._pending: Dict[str, int] = {}
+        self._seq = itertools.count()
         self.lock = Lock()
     
     def should_retry(self, retry_count: int, exit_code: Optional[int] = None) -> bool:
@@ -45,7 +64,7 @@ class RetryHandler:
     
     def schedule_retry(
         self,
-        job: Job,
+        job: 'Job',
         execution_id: str,
         retry_count: int,
         error_message: str
@@ -59,36 +78,64 @@ class RetryHandler:
             retry_count: Current retry count
             error_message: Error message from failed execution
         """
+        ready_at = time.monotonic_ns() + int(self.get_retry_delay(retry_count) * 1e9)
+        seq = next(self._seq)
         with self.lock:
-            self.retry_queue.append((job, execution_id, retry_count, error_message))
-            logger.info(
-                f"Scheduled retry {retry_count + 1}/{self.max_retries} for job {job.job_id} "
-                f"(execution {execution_id})"
+            generation = self._generations.get(job.job_id, 0)
+            self._pending[job.job_id] = self._pending.get(job.job_id, 0) + 1
+            heapq.heappush(
+                self._heap,
+                (ready_at, seq, generation, job, execution_id, retry_count, error_message)
             )
+        logger.info(
+            "Scheduled retry %d/%d for job %s (execution %s)",
+            retry_count + 1, self.max_retries, job.job_id, execution_id
+        )
+    
+    def get_retry_delay(self, retry_count: int) -> float:
+        """
+        Get the exponential backoff delay before a retry attempt.
+        
+        Args:
+            retry_count: Current retry count
+            
+        Returns:
+            Delay in seconds, capped at MAX_RETRY_DELAY
+        """
+        return min(self.retry_delay * (2 ** retry_count), self.MAX_RETRY_DELAY)
     
     def get_pending_retries(self) -> list:
-        """Get all pending retries that are ready to execute."""
+        """Get all pending retries whose backoff has expired."""
+        now = time.monotonic_ns()
+        ready_retries = []
         with self.lock:
-            ready_retries = []
-            remaining_retries = []
-            
-            for job, execution_id, retry_count, error_message in self.retry_queue:
-                # Simple retry delay: wait for retry_delay seconds
-                # In a more sophisticated implementation, we'd track when each retry was scheduled
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                _, _, generation, job, execution_id, retry_count, error_message = heapq.heappop(heap)
+                current = self._generations.get(job.job_id, 0)
+                remaining = self._pending[job.job_id] - 1
+                if remaining:
+                    self._pending[job.job_id] = remaining
+                else:
+                    del self._pending[job.job_id]
+                    self._generations.pop(job.job_id, None)
+                if generation != current:
+                    continue
                 ready_retries.append((job, execution_id, retry_count, error_message))
-            
-            self.retry_queue = remaining_retries
-            return ready_retries
+        return ready_retries
     
     def execute_retry(
         self,
-        job: Job,
+        job: 'Job',
         original_execution_id: str,
         retry_count: int
     ) -> tuple[bool, str, str, int]:
         """
         Execute a retry attempt.
         
+        The backoff has already elapsed by the time get_pending_retries
+        hands the retry out, so this runs the task immediately.
+        
         Args:
             job: The job to retry
             original_execution_id: Original execution ID
@@ -98,14 +145,10 @@ class RetryHandler:
             Tuple of (success, stdout, stderr, exit_code)
         """
         logger.info(
-            f"Executing retry {retry_count + 1}/{self.max_retries} for job {job.job_id} "
-            f"(original execution: {original_execution_id})"
+            "Executing retry %d/%d for job %s (original execution: %s)",
+            retry_count + 1, self.max_retries, job.job_id, original_execution_id
         )
         
-        # Wait before retrying (exponential backoff)
-        delay = self.retry_delay * (2 ** retry_count)
-        time.sleep(min(delay, 3600))  # Cap at 1 hour
-        
         # Execute the task
         executor = TaskExecutorFactory.get_executor(job.task.type)
         return executor.execute(job.task)
@@ -113,9 +156,7 @@ class RetryHandler:
     def clear_retries_for_job(self, job_id: str) -> None:
         """Clear all pending retries for a specific job."""
         with self.lock:
-            self.retry_queue = [
-                (job, exec_id, count, error)
-                for job, exec_id, count, error in self.retry_queue
-                if job.job_id != job_id
-            ]
+            # Nothing queued means nothing to invalidate
+            if job_id in self._pending:
+                self._generations[job_id] = self._generations.get(job_id, 0) + 1
 
@@ -1,34 +1,107 @@
 """File system watcher for dynamic job management."""
 import os
-import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
 
 from job_scheduler.models import Job
 from job_scheduler.core import JobScheduler
+from job_scheduler.utils.config import settings
+
+# Optional inotify-backed watching; falls back to polling when unavailable
+try:
+    from watchdog.events import (
+        FileSystemEventHandler,
+        FileCreatedEvent,
+        FileModifiedEvent,
+        FileDeletedEvent,
+        FileMovedEvent,
+    )
+    from watchdog.observers import Observer
+    _WATCHDOG_AVAILABLE = True
+except ImportError:
+    _WATCHDOG_AVAILABLE = False
+    FileSystemEventHandler = object  # type: ignore[misc,assignment]
+    Observer = None  # type: ignore[misc,assignment]
 
 logger = logging.getLogger(__name__)
 
 
+class _JobFileEventHandler(FileSystemEventHandler):
+    """Forwards watchdog events for job files to the JobFileWatcher."""
+    
+    # Only subscribe to what the watcher acts on (no open/access/close events)
+    EVENT_FILTER = (
+        [FileCreatedEvent, FileModifiedEvent, FileDeletedEvent, FileMovedEvent]
+        if _WATCHDOG_AVAILABLE else []
+    )
+    
+    def __init__(self, watcher: 'JobFileWatcher'):
+        super().__init__()
+        self.watcher = watcher
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self.watcher._schedule_change(os.fsdecode(event.src_path))
+    
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.watcher._schedule_change(os.fsdecode(event.src_path))
+    
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self.watcher._on_file_removed(os.fsdecode(event.src_path))
+    
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.watcher._on_file_moved(os.fsdecode(event.src_path), os.fsdecode(event.dest_path))
+
+
 class JobFileWatcher:
     """Monitors a directory for job definition files and updates the scheduler."""
     
-    def __init__(self, watch_directory: str, scheduler: JobScheduler):
+    # Quiet period after the last change event before a file is re-read
+    DEBOUNCE_SECONDS = 0.1
+    # Polling scans larger than this stat files on a thread pool, in chunks
+    PARALLEL_STAT_THRESHOLD = 512
+    STAT_CHUNK_SIZE = 128
+    
+    def __init__(self, watch_directory: str, scheduler: JobScheduler, use_polling: bool = False,
+                 poll_interval: Optional[float] = None):
         """
         Initialize the file watcher.
         
         Args:
             watch_directory: Path to directory containing job JSON files
             scheduler: The JobScheduler instance to update
+            use_polling: Poll the directory instead of using filesystem
+                notifications (e.g. for NFS/CIFS mounts)
+            poll_interval: Seconds between polling scans; defaults to
+                settings.file_watcher_interval
         """
         self.watch_directory = Path(watch_directory)
+        # Plain string form for the scan loop, so no Path objects are built per tick
+        self._watch_dir_str = str(self.watch_directory)
         self.scheduler = scheduler
+        self.use_polling = use_polling or not _WATCHDOG_AVAILABLE
+        self.poll_interval = settings.file_watcher_interval if poll_interval is None else poll_interval
         self.running = False
+        # Set by stop() so the polling loop wakes immediately instead of finishing its sleep
+        self._stop_event = threading.Event()
         self.watcher_thread: Optional[threading.Thread] = None
-        self.file_timestamps: Dict[str, float] = {}
+        self.file_timestamps: Dict[str, int] = {}  # file path -> st_mtime_ns
         self.file_to_job_id: Dict[str, str] = {}  # Track file path -> job_id mapping
+        # (st_dev, st_ino) of tracked files, so renames can be told apart from delete + add
+        self._file_keys: Dict[str, Tuple[int, int]] = {}
+        self._key_paths: Dict[Tuple[int, int], str] = {}
+        # file path -> (st_mtime_ns, st_size, Job) as of the last parse
+        self._job_cache: Dict[str, Tuple[int, int, Job]] = {}
+        self._stat_pool: Optional[ThreadPoolExecutor] = None
+        # Debounce timers for changed files, and a lock serializing event handling
+        self._pending: Dict[str, threading.Timer] = {}
+        self._events_lock = threading.Lock()
     
     def start(self):
         """Start watching the directory."""
@@ -40,85 +113,310 @@ class JobFileWatcher:
         self.watch_directory.mkdir(parents=True, exist_ok=True)
         
         # Load existing jobs on startup
-        self._load_existing_jobs()
+        scanned = self._load_existing_jobs()
         
         self.running = True
-        self.watcher_thread = threading.Thread(target=self._watch, daemon=True)
+        self._stop_event.clear()
+        if self.use_polling:
+            self.watcher_thread = threading.Thread(target=self._watch, daemon=True)
+        else:
+            # The observer is itself a thread; the kernel pushes changes to it
+            self.watcher_thread = Observer()
+            self.watcher_thread.schedule(
+                _JobFileEventHandler(self),
+                str(self.watch_directory),
+                recursive=False,
+                event_filter=_JobFileEventHandler.EVENT_FILTER,
+            )
+            self.watcher_thread.daemon = True
         self.watcher_thread.start()
-        logger.info(f"File watcher started for directory: {self.watch_directory}")
+        if not self.use_polling:
+            # Changes made between the scan and the observer starting produce no events
+            self._reconcile(scanned)
+        mode = "polling" if self.use_polling else "notifications"
+        logger.info(f"File watcher started for directory: {self.watch_directory} ({mode})")
     
     def stop(self):
         """Stop watching the directory."""
         self.running = False
+        self._stop_event.set()
         if self.watcher_thread:
+            if not self.use_polling:
+                self.watcher_thread.stop()
             self.watcher_thread.join(timeout=5)
+        with self._events_lock:
+            for timer in self._pending.values():
+                timer.cancel()
+            self._pending.clear()
+        if self._stat_pool is not None:
+            self._stat_pool.shutdown(wait=False)
+            self._stat_pool = None
         logger.info("File watcher stopped")
     
-    def _load_existing_jobs(self):
-        """Load all existing job files on startup."""
+    def _iter_json_entries(self) -> Iterator[os.DirEntry]:
+        """Yield directory entries for the job files in the watch directory."""
+        with os.scandir(self._watch_dir_str) as it:
+            for entry in it:
+                if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False):
+                    yield entry
+    
+    def _load_existing_jobs(self) -> Dict[str, Tuple[int, int]]:
+        """Load all existing job files on startup.
+        
+        Returns:
+            The (mtime_ns, size) of every job file seen by the scan, keyed by path
+        """
         if not self.watch_directory.exists():
             logger.warning(f"Watch directory does not exist: {self.watch_directory}")
-            return
+            return {}
+        
+        # Read and parse files concurrently; register them in order afterwards
+        files = []
+        for entry in self._iter_json_entries():
+            try:
+                files.append((entry.path, entry.stat(follow_symlinks=False)))
+            except OSError as e:
+                self._log_load_error(entry.path, e)
+        
+        if not files:
+            logger.info("No existing job files to load")
+            return {}
         
-        json_files = list(self.watch_directory.glob("*.json"))
-        logger.info(f"Loading {len(json_files)} existing job files")
+        loaded = 0
+        workers = min(32, (os.cpu_count() or 1) * 4, len(files))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jobload") as pool:
+            parsed = [(path, st, pool.submit(Job.from_json_file, path)) for path, st in files]
+            for file_path, st, future in parsed:
+                try:
+                    job = future.result()
+                    self.scheduler.add_job(job)
+                    self._remember(file_path, st)
+                    self._job_cache[file_path] = (st.st_mtime_ns, st.st_size, job)
+                    self.file_to_job_id[file_path] = job.job_id
+                    loaded += 1
+                except Exception as e:
+                    self._log_load_error(file_path, e)
+        logger.info(f"Loaded {loaded} existing job files")
+        return {path: (st.st_mtime_ns, st.st_size) for path, st in files}
+    
+    def _reconcile(self, scanned: Dict[str, Tuple[int, int]]):
+        """Apply job file changes made since the startup scan.
         
-        for json_file in json_files:
+        Args:
+            scanned: The (mtime_ns, size) of each file as seen by the startup scan
+        """
+        with self._events_lock:
             try:
-                job = Job.from_json_file(str(json_file))
-                self.scheduler.add_job(job)
-                file_path = str(json_file)
-                self.file_timestamps[file_path] = json_file.stat().st_mtime
-                self.file_to_job_id[file_path] = job.job_id
-            except Exception as e:
-                error_msg = f"Error loading job file {json_file}: {e}"
-                logger.error(error_msg)
-                # Log to scheduler.log via scheduler's logger
-                self.scheduler.scheduler_logger.log_error(error_msg=error_msg)
+                current_files = self._stat_chunk(list(self._iter_json_entries()))
+            except FileNotFoundError:
+                current_files = {}
+            for file_path in list(self.file_timestamps):
+                if file_path not in current_files:
+                    self._handle_deleted_file(file_path)
+                    self._forget(file_path)
+            for file_path, st in current_files.items():
+                if scanned.get(file_path) != (st.st_mtime_ns, st.st_size):
+                    self._on_file_changed(file_path)
+    
+    def _log_load_error(self, file_path: str, error: Exception):
+        """Report a job file that could not be loaded on startup."""
+        error_msg = f"Error loading job file {file_path}: {error}"
+        logger.error(error_msg)
+        # Log to scheduler.log via scheduler's logger
+        self.scheduler.scheduler_logger.log_error(error_msg=error_msg)
+    
+    @staticmethod
+    def _stat_chunk(entries: List[os.DirEntry]) -> Dict[str, os.stat_result]:
+        """Stat directory entries, skipping files removed since the scan."""
+        result = {}
+        for entry in entries:
+            try:
+                result[entry.path] = entry.stat(follow_symlinks=False)
+            except FileNotFoundError:
+                pass
+        return result
+    
+    def _stat_entries(self, entries: List[os.DirEntry]) -> Dict[str, os.stat_result]:
+        """
+        Stat the scanned job files, keyed by path.
+        
+        Large directories (typically on network filesystems, where polling is
+        used and each stat is a round trip) are split into chunks handed out
+        to a small thread pool; idle workers pick up the remaining chunks.
+        """
+        if len(entries) <= self.PARALLEL_STAT_THRESHOLD:
+            return self._stat_chunk(entries)
+        if self._stat_pool is None:
+            workers = min(8, (os.cpu_count() or 1) * 2)
+            self._stat_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jobstat")
+        size = self.STAT_CHUNK_SIZE
+        chunks = [entries[i:i + size] for i in range(0, len(entries), size)]
+        current_files: Dict[str, os.stat_result] = {}
+        for part in self._stat_pool.map(self._stat_chunk, chunks):
+            current_files.update(part)
+        return current_files
     
     def _watch(self):
-        """Main watch loop - checks for file changes periodically."""
+        """Polling watch loop - checks for file changes periodically."""
         while self.running:
             try:
-                if not self.watch_directory.exists():
-                    time.sleep(5)
+                try:
+                    entries = list(self._iter_json_entries())
+                except FileNotFoundError:
+                    # Watch directory missing (e.g. being re-created)
+                    self._stop_event.wait(5)
                     continue
                 
-                # Get current JSON files
-                current_files = {
-                    str(f): f.stat().st_mtime
-                    for f in self.watch_directory.glob("*.json")
-                }
+                current_files = self._stat_entries(entries)
+                deleted_files = self.file_timestamps.keys() - current_files.keys()
                 
-                # Check for new or modified files
-                for file_path, mtime in current_files.items():
-                    if file_path not in self.file_timestamps:
+                # Check for new, renamed or modified files
+                for file_path, st in current_files.items():
+                    key = (st.st_dev, st.st_ino)
+                    old_path = self._key_paths.get(key)
+                    if self._file_keys.get(file_path) != key and old_path in deleted_files:
+                        # Renamed file: same inode under a new name
+                        deleted_files.discard(old_path)
+                        self._rebind(old_path, file_path)
+                        if self.file_timestamps[file_path] != st.st_mtime_ns:
+                            self._handle_modified_file(file_path)
+                    elif file_path not in self.file_timestamps:
                         # New file
                         self._handle_new_file(file_path)
-                        self.file_timestamps[file_path] = mtime
-                    elif self.file_timestamps[file_path] != mtime:
+                    elif self.file_timestamps[file_path] != st.st_mtime_ns:
                         # Modified file
                         self._handle_modified_file(file_path)
-                        self.file_timestamps[file_path] = mtime
+                    else:
+                        continue
+                    self._remember(file_path, st)
                 
                 # Check for deleted files
-                deleted_files = set(self.file_timestamps.keys()) - set(current_files.keys())
                 for file_path in deleted_files:
                     self._handle_deleted_file(file_path)
-                    del self.file_timestamps[file_path]
+                    self._forget(file_path)
             
             except Exception as e:
                 error_msg = f"Error in file watcher loop: {e}"
                 logger.error(error_msg)
                 self.scheduler.scheduler_logger.log_error(error_msg=error_msg)
             
-            time.sleep(2)  # Check every 2 seconds
+            self._stop_event.wait(self.poll_interval)
+    
+    def _schedule_change(self, file_path: str):
+        """
+        Debounce a created, modified or moved-in file reported by the observer.
+        
+        Editors and partial writes produce bursts of events for one logical
+        change; only the last event of a burst re-reads the file.
+        """
+        if not file_path.endswith(".json"):
+            return
+        with self._events_lock:
+            timer = self._pending.pop(file_path, None)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(self.DEBOUNCE_SECONDS, self._on_debounced_change, args=(file_path,))
+            timer.daemon = True
+            self._pending[file_path] = timer
+            timer.start()
+    
+    def _on_debounced_change(self, file_path: str):
+        """Timer callback: handle the change unless it was superseded or the file removed."""
+        with self._events_lock:
+            if self._pending.get(file_path) is not threading.current_thread():
+                return
+            del self._pending[file_path]
+            self._on_file_changed(file_path)
+    
+    def _on_file_changed(self, file_path: str):
+        """Handle a created, modified or moved-in job file."""
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            # Already gone again; the delete event follows
+            return
+        if file_path in self.file_timestamps:
+            self._handle_modified_file(file_path)
+        else:
+            self._handle_new_file(file_path)
+        self._remember(file_path, st)
+    
+    def _on_file_removed(self, file_path: str):
+        """Handle a deleted or moved-out file reported by the observer."""
+        with self._events_lock:
+            timer = self._pending.pop(file_path, None)
+            if timer is not None:
+                timer.cancel()
+            if file_path in self.file_timestamps:
+                self._handle_deleted_file(file_path)
+                self._forget(file_path)
+    
+    def _on_file_moved(self, src_path: str, dest_path: str):
+        """Handle a file moved within the directory, rebinding tracked job files."""
+        with self._events_lock:
+            renamed = dest_path.endswith(".json") and src_path in self.file_timestamps
+            if renamed:
+                timer = self._pending.pop(src_path, None)
+                if timer is not None:
+                    timer.cancel()
+                self._rebind(src_path, dest_path)
+                try:
+                    changed = timer is not None or os.stat(dest_path).st_mtime_ns != self.file_timestamps[dest_path]
+                except FileNotFoundError:
+                    changed = False
+        if not renamed:
+            self._on_file_removed(src_path)
+            changed = True
+        if changed:
+            self._schedule_change(dest_path)
+    
+    def _remember(self, file_path: str, st: os.stat_result):
+        """Record the modification time and inode of a tracked job file."""
+        self.file_timestamps[file_path] = st.st_mtime_ns
+        key = (st.st_dev, st.st_ino)
+        old_key = self._file_keys.get(file_path)
+        if old_key != key and old_key is not None and self._key_paths.get(old_key) == file_path:
+            del self._key_paths[old_key]
+        self._file_keys[file_path] = key
+        self._key_paths[key] = file_path
+    
+    def _forget(self, file_path: str):
+        """Stop tracking a job file."""
+        self.file_timestamps.pop(file_path, None)
+        self._job_cache.pop(file_path, None)
+        key = self._file_keys.pop(file_path, None)
+        if key is not None and self._key_paths.get(key) == file_path:
+            del self._key_paths[key]
+    
+    def _rebind(self, old_path: str, new_path: str):
+        """Move the tracking of a renamed job file to its new path without touching the scheduler."""
+        logger.info("Job file renamed: %s -> %s", old_path, new_path)
+        job_id = self.file_to_job_id.pop(old_path, None)
+        if new_path in self.file_timestamps:
+            # Renamed over another tracked file, whose job goes away unless it is the same one
+            if self.file_to_job_id.get(new_path) == job_id:
+                self.file_to_job_id.pop(new_path, None)
+            else:
+                self._handle_deleted_file(new_path)
+            self._forget(new_path)
+        self.file_timestamps[new_path] = self.file_timestamps.pop(old_path)
+        if job_id is not None:
+            self.file_to_job_id[new_path] = job_id
+        cached = self._job_cache.pop(old_path, None)
+        if cached is not None:
+            self._job_cache[new_path] = cached
+        key = self._file_keys.pop(old_path, None)
+        if key is not None:
+            self._file_keys[new_path] = key
+            self._key_paths[key] = new_path
     
     def _handle_new_file(self, file_path: str):
         """Handle a newly added job file."""
         try:
-            logger.info(f"New job file detected: {file_path}")
+            logger.info("New job file detected: %s", file_path)
+            st = os.stat(file_path)
             job = Job.from_json_file(file_path)
+            self._job_cache[file_path] = (st.st_mtime_ns, st.st_size, job)
             self.scheduler.add_job(job)
             self.file_to_job_id[file_path] = job.job_id
         except Exception as e:
@@ -129,8 +427,17 @@ class JobFileWatcher:
     def _handle_modified_file(self, file_path: str):
         """Handle a modified job file."""
         try:
-            logger.info(f"Job file modified: {file_path}")
+            logger.info("Job file modified: %s", file_path)
+            st = os.stat(file_path)
+            cached = self._job_cache.get(file_path)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return
             job = Job.from_json_file(file_path)
+            self._job_cache[file_path] = (st.st_mtime_ns, st.st_size, job)
+            if cached is not None and cached[2] == job and self.file_to_job_id.get(file_path) == job.job_id:
+                # Touched or rewritten with identical content
+                logger.debug("Job file unchanged: %s", file_path)
+                return
             # If job_id changed, remove old job
             if file_path in self.file_to_job_id:
                 old_job_id = self.file_to_job_id[file_path]
@@ -146,13 +453,13 @@ class JobFileWatcher:
     def _handle_deleted_file(self, file_path: str):
         """Handle a deleted job file."""
         try:
-            logger.info(f"Job file deleted: {file_path}")
+            logger.info("Job file deleted: %s", file_path)
             if file_path in self.file_to_job_id:
                 job_id = self.file_to_job_id[file_path]
                 self.scheduler.remove_job(job_id)
                 del self.file_to_job_id[file_path]
             else:
-                logger.warning(f"Could not determine job_id for deleted file: {file_path}")
+                logger.warning("Could not determine job_id for deleted file: %s", file_path)
         except Exception as e:
             error_msg = f"Error processing deleted job file {file_path}: {e}"
             logger.error(error_msg)
@@ -1,10 +1,18 @@
 """Pytest configuration and fixtures."""
 import pytest
 import tempfile
+import time
 import shutil
 from pathlib import Path
 
 
+def wait_until(condition, timeout: float = 3.0) -> None:
+    """Poll condition until it holds or timeout expires (callers assert afterwards)."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+
 @pytest.fixture
 def temp_jobs_dir():
     """Create a temporary directory for job files."""
@@ -34,6 +34,14 @@ class TestSettings:
             test_settings = Settings(log_level=level)
             assert test_settings.log_level == level
     
+    def test_task_type_workers_from_environment(self):
+        """Test that dedicated worker pool sizes are read as JSON from the environment."""
+        with patch.dict(os.environ, {"TASK_TYPE_WORKERS": '{"execute_command": 4}'}):
+            assert Settings().task_type_workers == {"execute_command": 4}
+        assert Settings().task_type_workers == {}
+        with pytest.raises(ValueError):
+            Settings(task_type_workers={"execute_command": 0})
+    
     def test_database_url_validation(self):
         """Test database URL validation."""
         with pytest.raises(ValueError):
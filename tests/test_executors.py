@@ -20,6 +20,16 @@ class TestExecuteCommandExecutor:
         assert exit_code == 0
         assert "success" in stdout or stdout == ""
     
+    def test_execute_argv_without_shell(self):
+        """Test an argv task is run directly, without shell interpretation."""
+        executor = ExecuteCommandExecutor()
+        task = ExecuteCommandTask("echo '$HOME'", argv=["echo", "$HOME"])
+        
+        success, stdout, stderr, exit_code = executor.execute(task)
+        
+        assert success is True
+        assert stdout == "$HOME\n"
+    
     def test_execute_failure(self):
         """Test failed command execution."""
         executor = ExecuteCommandExecutor()
@@ -35,14 +45,38 @@ class TestExecuteCommandExecutor:
         executor = ExecuteCommandExecutor()
         task = ExecuteCommandTask("sleep 10")
         
-        with patch('job_scheduler.executors.task_executors.subprocess.run') as mock_run:
-            mock_run.side_effect = TimeoutError("Command timed out")
+        with patch('job_scheduler.executors.task_executors.subprocess.Popen') as mock_popen:
+            mock_popen.side_effect = TimeoutError("Command timed out")
             
             success, stdout, stderr, exit_code = executor.execute(task)
             
             assert success is False
             assert exit_code == -1
     
+    def test_execute_timeout_kills_command(self):
+        """Test a command running past the timeout is killed."""
+        executor = ExecuteCommandExecutor()
+        executor.TIMEOUT_SECONDS = 0.2
+        task = ExecuteCommandTask("sleep 10")
+        
+        success, stdout, stderr, exit_code = executor.execute(task)
+        
+        assert success is False
+        assert stderr == "Command timed out"
+        assert exit_code == -1
+    
+    def test_large_output_keeps_tail(self):
+        """Test only the tail of a large output is returned."""
+        executor = ExecuteCommandExecutor()
+        executor.MAX_OUTPUT_BYTES = 1024
+        task = ExecuteCommandTask("seq 1 100000")
+        
+        success, stdout, stderr, exit_code = executor.execute(task)
+        
+        assert success is True
+        assert len(stdout) == 1024
+        assert stdout.endswith("99999\n100000\n")
+    
     def test_execute_exception(self):
         """Test exception handling during execution."""
         executor = ExecuteCommandExecutor()
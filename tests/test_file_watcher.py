@@ -8,7 +8,11 @@ import json
 
 from job_scheduler.core import JobScheduler
 from job_scheduler.watchers import JobFileWatcher
+from job_scheduler.watchers import file_watcher
 from job_scheduler.models import Job
+from job_scheduler.utils.config import settings
+
+from tests.conftest import wait_until
 
 
 class TestJobFileWatcher:
@@ -81,6 +85,7 @@ class TestJobFileWatcher:
         assert "job-2" in watcher.scheduler.jobs
         assert str(job1) in watcher.file_timestamps
         assert str(job2) in watcher.file_timestamps
+        assert watcher.file_timestamps[str(job1)] == job1.stat().st_mtime_ns
         assert watcher.file_to_job_id[str(job1)] == "job-1"
         assert watcher.file_to_job_id[str(job2)] == "job-2"
     
@@ -109,8 +114,8 @@ class TestJobFileWatcher:
             }
         }))
         
-        # Wait for watcher to detect (check interval is 2 seconds)
-        time.sleep(3)
+        wait_until(lambda: watcher.file_to_job_id.get(str(new_job)) == "new-job"
+                    and str(new_job) in watcher.file_timestamps)
         
         assert "new-job" in watcher.scheduler.jobs
         assert str(new_job) in watcher.file_timestamps
@@ -149,8 +154,7 @@ class TestJobFileWatcher:
             }
         }))
         
-        # Wait for watcher to detect
-        time.sleep(3)
+        wait_until(lambda: watcher.scheduler.jobs["modify-job"].description == "Modified")
         
         assert watcher.scheduler.jobs["modify-job"].description == "Modified"
         assert watcher.scheduler.jobs["modify-job"].schedule == "0 * * * *"
@@ -179,8 +183,9 @@ class TestJobFileWatcher:
         # Delete the file
         job_file.unlink()
         
-        # Wait for watcher to detect
-        time.sleep(3)
+        wait_until(lambda: "delete-job" not in watcher.scheduler.jobs
+                    and str(job_file) not in watcher.file_to_job_id
+                    and str(job_file) not in watcher.file_timestamps)
         
         assert "delete-job" not in watcher.scheduler.jobs
         assert str(job_file) not in watcher.file_timestamps
@@ -219,8 +224,7 @@ class TestJobFileWatcher:
             }
         }))
         
-        # Wait for watcher to detect
-        time.sleep(3)
+        wait_until(lambda: watcher.file_to_job_id.get(str(job_file)) == "new-id")
         
         # Old job should be removed, new job added
         assert "old-id" not in watcher.scheduler.jobs
@@ -246,14 +250,209 @@ class TestJobFileWatcher:
                 }
             }))
         
-        # Wait for watcher to detect
-        time.sleep(3)
+        wait_until(lambda: all(f"multi-{i}" in watcher.scheduler.jobs for i in range(3)))
         
         for i in range(3):
             assert f"multi-{i}" in watcher.scheduler.jobs
         
         watcher.stop()
     
+    @pytest.mark.skipif(not file_watcher._WATCHDOG_AVAILABLE, reason="watchdog not installed")
+    def test_notification_mode_reacts_quickly(self, temp_dir, watcher):
+        """Test that filesystem notifications pick up changes well before a poll would."""
+        watcher.start()
+        assert not watcher.use_polling
+        
+        job_file = temp_dir / "fast-job.json"
+        job_file.write_text(json.dumps({
+            "job_id": "fast-job",
+            "description": "Fast job",
+            "schedule": "* * * * *",
+            "task": {
+                "type": "execute_command",
+                "command": "echo 'fast'"
+            }
+        }))
+        
+        wait_until(lambda: "fast-job" in watcher.scheduler.jobs, timeout=1)
+        assert "fast-job" in watcher.scheduler.jobs
+        
+        job_file.unlink()
+        wait_until(lambda: "fast-job" not in watcher.scheduler.jobs, timeout=1)
+        assert "fast-job" not in watcher.scheduler.jobs
+        assert str(job_file) not in watcher.file_to_job_id
+        
+        watcher.stop()
+    
+    @pytest.mark.skipif(not file_watcher._WATCHDOG_AVAILABLE, reason="watchdog not installed")
+    def test_file_written_during_startup_is_loaded(self, temp_dir, watcher):
+        """Test that a file written after the startup scan but before the observer runs is loaded."""
+        load_existing_jobs = watcher._load_existing_jobs
+        
+        def load_then_write():
+            scanned = load_existing_jobs()
+            (temp_dir / "late-job.json").write_text(json.dumps({
+                "job_id": "late-job",
+                "description": "Late job",
+                "schedule": "* * * * *",
+                "task": {
+                    "type": "execute_command",
+                    "command": "echo 'late'"
+                }
+            }))
+            return scanned
+        
+        watcher._load_existing_jobs = load_then_write
+        watcher.start()
+        
+        wait_until(lambda: "late-job" in watcher.scheduler.jobs, timeout=1)
+        assert "late-job" in watcher.scheduler.jobs
+        
+        watcher.stop()
+    
+    @pytest.mark.skipif(not file_watcher._WATCHDOG_AVAILABLE, reason="watchdog not installed")
+    def test_burst_of_writes_reparsed_once(self, temp_dir, watcher):
+        """Test that rapid successive writes to a file are handled as one change."""
+        job_file = temp_dir / "burst-job.json"
+        job_data = {
+            "job_id": "burst-job",
+            "description": "Burst 0",
+            "schedule": "* * * * *",
+            "task": {
+                "type": "execute_command",
+                "command": "echo 'burst'"
+            }
+        }
+        job_file.write_text(json.dumps(job_data))
+        watcher.start()
+        
+        handled = []
+        original = watcher._handle_modified_file
+        watcher._handle_modified_file = lambda path: (handled.append(path), original(path))
+        
+        for i in range(1, 6):
+            job_data["description"] = f"Burst {i}"
+            job_file.write_text(json.dumps(job_data))
+        time.sleep(0.5)
+        
+        assert handled == [str(job_file)]
+        assert watcher.scheduler.jobs["burst-job"].description == "Burst 5"
+        
+        watcher.stop()
+    
+    @pytest.mark.parametrize("use_polling", [False, True])
+    def test_rename_keeps_job_scheduled(self, temp_dir, scheduler, use_polling):
+        """Test that renaming a job file rebinds it instead of removing and re-adding the job."""
+        if not use_polling and not file_watcher._WATCHDOG_AVAILABLE:
+            pytest.skip("watchdog not installed")
+        old_file = temp_dir / "rename-me.json"
+        old_file.write_text(json.dumps({
+            "job_id": "rename-job",
+            "description": "Renamed",
+            "schedule": "* * * * *",
+            "task": {
+                "type": "execute_command",
+                "command": "echo 'rename'"
+            }
+        }))
+        watcher = JobFileWatcher(str(temp_dir), scheduler, use_polling=use_polling, poll_interval=0.1)
+        watcher.start()
+        scheduled_job = scheduler.scheduled_jobs["rename-job"]
+        
+        new_file = temp_dir / "renamed.json"
+        old_file.rename(new_file)
+        wait_until(lambda: str(new_file) in watcher.file_to_job_id)
+        
+        assert scheduler.scheduled_jobs["rename-job"] is scheduled_job
+        assert not scheduled_job.cancelled
+        assert watcher.file_to_job_id == {str(new_file): "rename-job"}
+        assert set(watcher.file_timestamps) == {str(new_file)}
+        
+        watcher.stop()
+    
+    @pytest.mark.skipif(not file_watcher._WATCHDOG_AVAILABLE, reason="watchdog not installed")
+    def test_touched_file_not_re_added(self, temp_dir, watcher):
+        """Test that a touch without content changes does not update the job."""
+        job_file = temp_dir / "touch-job.json"
+        job_file.write_text(json.dumps({
+            "job_id": "touch-job",
+            "description": "Touched",
+            "schedule": "* * * * *",
+            "task": {
+                "type": "execute_command",
+                "command": "echo 'touch'"
+            }
+        }))
+        watcher.start()
+        
+        added = []
+        original = watcher.scheduler.add_job
+        watcher.scheduler.add_job = lambda job: (added.append(job.job_id), original(job))
+        
+        job_file.touch()
+        time.sleep(0.5)
+        assert added == []
+        
+        job_file.write_text(job_file.read_text().replace("Touched", "Edited"))
+        time.sleep(0.5)
+        assert added == ["touch-job"]
+        assert watcher.scheduler.jobs["touch-job"].description == "Edited"
+        
+        watcher.stop()
+    
+    def test_parallel_stat_matches_serial(self, temp_dir, watcher):
+        """Test that chunked parallel stats return the same result as a serial scan."""
+        for i in range(10):
+            (temp_dir / f"stat-{i}.json").write_text("{}")
+        entries = list(watcher._iter_json_entries())
+        
+        serial = watcher._stat_entries(entries)
+        watcher.PARALLEL_STAT_THRESHOLD = 0
+        watcher.STAT_CHUNK_SIZE = 3
+        parallel = watcher._stat_entries(entries)
+        
+        assert parallel.keys() == serial.keys()
+        assert len(parallel) == 10
+        assert watcher._stat_pool is not None
+        watcher.stop()
+        assert watcher._stat_pool is None
+    
+    def test_polling_mode(self, temp_dir, scheduler):
+        """Test that the polling fallback detects new files."""
+        watcher = JobFileWatcher(str(temp_dir), scheduler, use_polling=True, poll_interval=0.1)
+        watcher.start()
+        
+        job_file = temp_dir / "polled-job.json"
+        job_file.write_text(json.dumps({
+            "job_id": "polled-job",
+            "description": "Polled job",
+            "schedule": "* * * * *",
+            "task": {
+                "type": "execute_command",
+                "command": "echo 'polled'"
+            }
+        }))
+        
+        wait_until(lambda: watcher.file_to_job_id.get(str(job_file)) == "polled-job")
+        
+        assert "polled-job" in watcher.scheduler.jobs
+        assert watcher.file_to_job_id[str(job_file)] == "polled-job"
+        
+        watcher.stop()
+        assert not watcher.watcher_thread.is_alive()
+    
+    def test_stop_interrupts_poll_wait(self, temp_dir, scheduler):
+        """Test that stop() does not wait out the polling interval."""
+        watcher = JobFileWatcher(str(temp_dir), scheduler, use_polling=True, poll_interval=60)
+        assert JobFileWatcher(str(temp_dir), scheduler).poll_interval == settings.file_watcher_interval
+        watcher.start()
+        time.sleep(0.1)  # Let the loop reach its wait
+        
+        started = time.monotonic()
+        watcher.stop()
+        assert time.monotonic() - started < 1
+        assert not watcher.watcher_thread.is_alive()
+    
     def test_nonexistent_directory(self):
         """Test watcher with nonexistent directory."""
         scheduler = JobScheduler()
@@ -324,7 +523,7 @@ class TestJobFileWatcher:
             }
         }))
         
-        time.sleep(1)
+        wait_until(lambda: "concurrent" in watcher.scheduler.jobs)
         
         # Modify
         job_file.write_text(json.dumps({
@@ -337,13 +536,13 @@ class TestJobFileWatcher:
             }
         }))
         
-        time.sleep(1)
+        wait_until(lambda: watcher.scheduler.jobs["concurrent"].schedule == "0 * * * *")
         
         # Delete
         job_file.unlink()
         
         # Wait for all operations to be processed
-        time.sleep(3)
+        wait_until(lambda: "concurrent" not in watcher.scheduler.jobs)
         
         assert "concurrent" not in watcher.scheduler.jobs
         
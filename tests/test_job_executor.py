@@ -0,0 +1,50 @@
+"""Tests for the job executor."""
+import time
+
+from job_scheduler.core import job_executor
+from job_scheduler.core.job_executor import JobExecutor
+from job_scheduler.core.scheduled_job import ScheduledJob
+from job_scheduler.logging import JobLogger, SchedulerLogger
+from job_scheduler.models import Job, ExecuteCommandTask
+
+
+class TestJobExecutor:
+    """Test cases for JobExecutor."""
+    
+    def test_execute_uses_worker_pool(self, tmp_path):
+        """Test that executions run on a reusable worker pool."""
+        executor = JobExecutor(JobLogger(str(tmp_path)), SchedulerLogger(str(tmp_path)), max_workers=2)
+        job = Job("pool-job", "", "* * * * *", ExecuteCommandTask("true"))
+        
+        for _ in range(3):
+            executor.execute(ScheduledJob(job))
+        executor.shutdown(wait=True)
+        
+        assert len(list((tmp_path / "pool-job").iterdir())) == 3
+    
+    def test_dedicated_pool_per_task_type(self, tmp_path):
+        """Test that configured task types get their own pool."""
+        executor = JobExecutor(
+            JobLogger(str(tmp_path)), SchedulerLogger(str(tmp_path)),
+            max_workers=2, task_type_workers={"execute_command": 1}
+        )
+        assert executor._get_pool("execute_command") is not executor._get_pool("other")
+        executor.shutdown()
+    
+    def test_pool_recreated_after_shutdown(self, tmp_path):
+        """Test that the executor can be reused after shutdown."""
+        executor = JobExecutor(JobLogger(str(tmp_path)), SchedulerLogger(str(tmp_path)))
+        job = Job("restart-job", "", "* * * * *", ExecuteCommandTask("true"))
+        executor.shutdown()
+        
+        executor.execute(ScheduledJob(job))
+        executor.shutdown(wait=True)
+        assert (tmp_path / "restart-job").exists()
+    
+    def test_execution_ids_unique_across_restarts(self):
+        """Test execution IDs differ within a process and after a restart."""
+        first = {job_executor._new_execution_id() for _ in range(1000)}
+        assert len(first) == 1000
+        
+        job_executor._reset_execution_ids()
+        assert job_executor._new_execution_id() not in first
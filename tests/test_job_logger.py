@@ -0,0 +1,40 @@
+"""Tests for job execution logging."""
+from datetime import datetime, timezone
+
+from job_scheduler.logging import JobLogger
+
+
+class TestJobLogger:
+    """Test cases for JobLogger."""
+    
+    def test_log_execution_written_after_flush(self, tmp_path):
+        """Test that queued execution records reach disk on flush."""
+        job_logger = JobLogger(str(tmp_path))
+        now = datetime.now(timezone.utc)
+        
+        job_logger.log_execution(
+            job_id="log-job", execution_id="abc123", start_time=now, end_time=now,
+            duration_seconds=0.0, status="SUCCESS", command="echo hi",
+            exit_code=0, stdout="hi", stderr=""
+        )
+        job_logger.flush()
+        
+        content = (tmp_path / "log-job" / "abc123.log").read_text()
+        assert content.startswith("execution_id: abc123\njob_id: log-job\ncommand: echo hi\n")
+        assert "status: SUCCESS\nexit_code: 0\nstdout:\nhi\nstderr:\n" in content
+    
+    def test_job_directory_recreated_after_removal(self, tmp_path):
+        """Test that a removed job directory is created again."""
+        job_logger = JobLogger(str(tmp_path))
+        now = datetime.now(timezone.utc)
+        record = dict(job_id="log-job", start_time=now, end_time=now,
+                      duration_seconds=0.0, status="SUCCESS")
+        
+        job_logger.log_execution(execution_id="first", **record)
+        job_logger.flush()
+        (tmp_path / "log-job" / "first.log").unlink()
+        (tmp_path / "log-job").rmdir()
+        
+        job_logger.log_execution(execution_id="second", **record)
+        job_logger.flush()
+        assert (tmp_path / "log-job" / "second.log").exists()
@@ -2,7 +2,8 @@
 import pytest
 from datetime import datetime
 
-from job_scheduler.models import Job, Task, ExecuteCommandTask
+from job_scheduler.models import Job, Task, ExecuteCommandTask, register_task
+from job_scheduler.models import job_models
 
 
 class TestTask:
@@ -24,6 +25,42 @@ class TestTask:
         assert isinstance(task, ExecuteCommandTask)
         assert task.command == "echo 'test'"
     
+    def test_task_to_dict_round_trip(self):
+        """Test that to_dict produces input accepted by from_dict."""
+        task = ExecuteCommandTask("echo 'test'")
+        assert task.to_dict() == {"type": "execute_command", "command": "echo 'test'"}
+        assert Task.from_dict(task.to_dict()) == task
+    
+    def test_task_argv(self):
+        """Test that an argv list is accepted and defaults the command string."""
+        task = Task.from_dict({"type": "execute_command", "argv": ["echo", "a b"]})
+        assert task.argv == ["echo", "a b"]
+        assert task.command == "echo 'a b'"
+        assert Task.from_dict(task.to_dict()) == task
+        
+        with pytest.raises(ValueError):
+            Task.from_dict({"type": "execute_command", "argv": "echo hi"})
+    
+    def test_models_use_slots(self):
+        """Test that tasks and jobs carry no per-instance __dict__."""
+        task = ExecuteCommandTask("echo 'test'")
+        job = Job("test-job", "Test", "* * * * *", task)
+        assert not hasattr(task, "__dict__")
+        assert not hasattr(job, "__dict__")
+    
+    def test_register_task(self, monkeypatch):
+        """Test that registered task types are dispatched by Task.from_dict."""
+        monkeypatch.setattr(job_models, "_TASK_TYPES", dict(job_models._TASK_TYPES))
+        
+        @register_task("noop")
+        class NoopTask(Task):
+            @classmethod
+            def from_dict(cls, data):
+                return cls(type="noop")
+        
+        task = Task.from_dict({"type": "noop"})
+        assert isinstance(task, NoopTask)
+    
     def test_invalid_task_type(self):
         """Test that invalid task type raises error."""
         task_data = {
@@ -107,6 +144,29 @@ class TestJob:
                 "schedule": "0 * * * *"
             })
     
+    def test_numeric_epoch_schedule(self):
+        """Test that epoch seconds given as a number are accepted only when whole."""
+        data = {"job_id": "epoch-job", "task": {"type": "execute_command", "command": "echo"}}
+        for schedule in (1758333600, 1758333600.0):
+            job = Job.from_dict(dict(data, schedule=schedule))
+            assert job.schedule == "1758333600"
+            assert job.is_one_time_schedule()
+        
+        direct = Job("epoch-job", "", 1758333600, ExecuteCommandTask("echo"))
+        assert direct.schedule == "1758333600"
+        
+        for schedule in (1758333600.5, True, ["* * * * *"]):
+            with pytest.raises(ValueError, match="whole epoch seconds"):
+                Job.from_dict(dict(data, schedule=schedule))
+    
+    def test_job_id_interned(self):
+        """Test that equal job_ids from separate loads are the same object."""
+        data = {"job_id": "".join(["interned", "-job"]), "schedule": "* * * * *",
+                "task": {"type": "execute_command", "command": "echo 'test'"}}
+        first = Job.from_dict(data)
+        second = Job.from_dict(dict(data, job_id="".join(["interned-", "job"])))
+        assert first.job_id is second.job_id
+    
     def test_is_cron_schedule(self):
         """Test cron schedule detection."""
         task = ExecuteCommandTask("echo 'test'")
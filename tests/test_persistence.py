@@ -0,0 +1,105 @@
+"""Tests for the database persistence layer."""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event
+
+from job_scheduler.database import db_session
+from job_scheduler.database.persistence import (
+    _BatchWriter, ExecutionPersistence, JobPersistence
+)
+from job_scheduler.models import Job, JobExecutionModel, ExecuteCommandTask
+from job_scheduler.models.db_models import Base
+from job_scheduler.utils.config import settings
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    """Bind the persistence layer to a temporary SQLite database."""
+    database_url = f"sqlite:///{tmp_path_factory.mktemp('db') / 'jobscheduler.db'}"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "database_url", database_url)
+        engine = db_session.get_engine()
+    Base.metadata.create_all(bind=engine)
+    db_session.SessionLocal.configure(bind=engine)
+    yield engine
+    db_session.ScopedSession.remove()
+    db_session.SessionLocal.configure(bind=db_session.engine)
+    engine.dispose()
+
+
+def _execution(execution_id: str) -> dict:
+    """Build a job_executions row."""
+    return dict(
+        execution_id=execution_id,
+        job_id="persisted-job",
+        start_time=datetime.now(timezone.utc),
+        end_time=None,
+        duration_seconds=None,
+        status="SUCCESS",
+        exit_code=0,
+        stdout=None,
+        stderr=None,
+        error_message=None,
+        retry_count=0
+    )
+
+
+def _execution_ids(engine) -> set:
+    """Return the execution ids stored in the database."""
+    with engine.connect() as conn:
+        return {row[0] for row in conn.execute(JobExecutionModel.__table__.select())}
+
+
+class TestExecutionPersistence:
+    """Test cases for batched execution writes."""
+    
+    def test_batched_rows_visible_after_flush(self, engine):
+        """Test that queued executions are all written once flush() returns."""
+        for i in range(5):
+            ExecutionPersistence.save_execution(
+                execution_id=f"flushed-{i}",
+                job_id="persisted-job",
+                start_time=datetime.now(timezone.utc),
+                end_time=None,
+                duration_seconds=None,
+                status="SUCCESS"
+            )
+        ExecutionPersistence.flush()
+        
+        assert {f"flushed-{i}" for i in range(5)} <= _execution_ids(engine)
+    
+    def test_failing_row_does_not_lose_batch(self, engine):
+        """Test that a duplicate execution_id only loses its own row."""
+        writer = _BatchWriter(JobExecutionModel)
+        writer._write([_execution("existing")])
+        
+        writer._write([_execution("before"), _execution("existing"), _execution("after")])
+        
+        assert {"existing", "before", "after"} <= _execution_ids(engine)
+
+
+class TestJobPersistence:
+    """Test cases for job persistence."""
+    
+    def test_unchanged_save_issues_no_update(self, engine):
+        """Test that saving an unchanged job does not UPDATE its row."""
+        job = Job("persisted-job", "Persisted", "* * * * *", ExecuteCommandTask("echo 'test'"))
+        JobPersistence.save_job(job)
+        
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            JobPersistence.save_job(job)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        
+        assert statements
+        assert not any(s.lstrip().upper().startswith("UPDATE") for s in statements)
+        
+        loaded = JobPersistence.load_job("persisted-job")
+        assert loaded == job
@@ -0,0 +1,29 @@
+"""Tests for the resource limiter."""
+from job_scheduler.utils import ResourceLimiter
+
+
+class TestResourceLimiter:
+    """Test cases for ResourceLimiter."""
+    
+    def test_acquire_up_to_limit(self):
+        """Test that acquisitions beyond max_concurrent are refused."""
+        limiter = ResourceLimiter()
+        for i in range(limiter.max_concurrent):
+            assert limiter.acquire(f"job-{i}", f"exec-{i}")
+        
+        assert not limiter.acquire("job-extra", "exec-extra")
+        assert limiter.get_active_count() == limiter.max_concurrent
+        
+        limiter.release("job-0")
+        assert limiter.acquire("job-extra", "exec-extra")
+        assert limiter.get_active_jobs()["job-extra"] == "exec-extra"
+    
+    def test_double_release_returns_one_permit(self):
+        """Test that releasing a job twice does not raise or over-release."""
+        limiter = ResourceLimiter()
+        limiter.acquire("job-1", "exec-1")
+        limiter.release("job-1")
+        limiter.release("job-1")
+        
+        assert limiter.get_active_count() == 0
+        assert limiter.get_active_jobs() == {}
@@ -0,0 +1,70 @@
+"""Tests for the retry handler."""
+from job_scheduler.models import Job
+from job_scheduler.utils import RetryHandler
+
+
+def _make_job(job_id: str) -> Job:
+    return Job.from_dict({
+        "job_id": job_id,
+        "schedule": "* * * * *",
+        "task": {"type": "execute_command", "command": "echo retry"}
+    })
+
+
+class TestRetryHandler:
+    """Test cases for RetryHandler."""
+    
+    def test_pending_retries_returned_once(self):
+        """Test that a ready retry is handed out exactly once."""
+        handler = RetryHandler()
+        handler.retry_delay = 0
+        handler.schedule_retry(_make_job("job-1"), "exec-1", 0, "boom")
+        
+        ready = handler.get_pending_retries()
+        assert [(job.job_id, exec_id, count, error) for job, exec_id, count, error in ready] == [
+            ("job-1", "exec-1", 0, "boom")
+        ]
+        assert handler.get_pending_retries() == []
+    
+    def test_clear_retries_for_job(self):
+        """Test that clearing one job's retries leaves other jobs queued."""
+        handler = RetryHandler()
+        handler.retry_delay = 0
+        handler.schedule_retry(_make_job("job-1"), "exec-1", 0, "boom")
+        handler.schedule_retry(_make_job("job-2"), "exec-2", 0, "boom")
+        handler.clear_retries_for_job("job-1")
+        
+        ready = handler.get_pending_retries()
+        assert [job.job_id for job, _, _, _ in ready] == ["job-2"]
+    
+    def test_retry_scheduled_after_clear_is_kept(self):
+        """Test that a retry queued after a clear is not dropped."""
+        handler = RetryHandler()
+        handler.retry_delay = 0
+        handler.schedule_retry(_make_job("job-1"), "exec-1", 0, "old")
+        handler.clear_retries_for_job("job-1")
+        handler.schedule_retry(_make_job("job-1"), "exec-2", 0, "new")
+        
+        ready = handler.get_pending_retries()
+        assert [exec_id for _, exec_id, _, _ in ready] == ["exec-2"]
+    
+    def test_generations_dropped_when_drained(self):
+        """Test that a cleared job's generation is forgotten once its retries are gone."""
+        handler = RetryHandler()
+        handler.retry_delay = 0
+        handler.clear_retries_for_job("idle-job")
+        handler.schedule_retry(_make_job("job-1"), "exec-1", 0, "old")
+        handler.clear_retries_for_job("job-1")
+        
+        assert handler.get_pending_retries() == []
+        assert handler._generations == {}
+        assert handler._pending == {}
+    
+    def test_retry_waits_for_backoff(self):
+        """Test that a retry is not handed out before its backoff expires."""
+        handler = RetryHandler()
+        handler.retry_delay = 60
+        handler.schedule_retry(_make_job("job-1"), "exec-1", 2, "boom")
+        
+        assert handler.get_retry_delay(2) == 240
+        assert handler.get_pending_retries() == []
@@ -1,9 +1,11 @@
 """Tests for schedule manager."""
+import sys
 import pytest
 from datetime import datetime, timezone
 
-from job_scheduler.core.schedule_manager import ScheduleManager
-from job_scheduler.models import Job, ExecuteCommandTask
+from job_scheduler.core.schedule_manager import ScheduleManager, _parsed_fields, _parse_schedule_time
+from job_scheduler.models import Job, Task, ExecuteCommandTask
+from job_scheduler.executors import TaskExecutorFactory
 from job_scheduler.logging import SchedulerLogger
 
 
@@ -25,6 +27,19 @@ class TestScheduleManager:
         assert scheduled_job is not None
         assert scheduled_job.job == job
     
+    def test_executor_resolved_at_scheduling(self, schedule_manager):
+        """Test that the task executor is attached when the job is scheduled."""
+        job = Job("test", "", "0 * * * *", ExecuteCommandTask("echo 'test'"))
+        
+        scheduled_job = schedule_manager.create_scheduled_job(job)
+        assert scheduled_job.executor is TaskExecutorFactory.get_executor("execute_command")
+    
+    def test_unsupported_task_type(self, schedule_manager):
+        """Test that a job with no registered executor is not scheduled."""
+        job = Job("test", "", "0 * * * *", Task(type="unsupported"))
+        
+        assert schedule_manager.create_scheduled_job(job) is None
+    
     def test_create_one_time_job(self, schedule_manager):
         """Test creating a one-time scheduled job."""
         task = ExecuteCommandTask("echo 'test'")
@@ -60,3 +75,43 @@ class TestScheduleManager:
         scheduled_job = schedule_manager.create_scheduled_job(job)
         assert scheduled_job is None
 
+    
+    def test_cron_expansion_is_cached(self, schedule_manager):
+        """Test that repeated schedules reuse the cached cron expansion."""
+        task = ExecuteCommandTask("echo 'test'")
+        schedule_manager.create_scheduled_job(Job("a", "", "*/7 * * * *", task))
+        hits = _parsed_fields.cache_info().hits
+        
+        scheduled_job = schedule_manager.create_scheduled_job(Job("b", "", "*/7 * * * *", task))
+        assert scheduled_job is not None
+        assert _parsed_fields.cache_info().hits == hits + 1
+    
+    def test_one_time_parse_is_cached(self):
+        """Test that one-time schedules are parsed once and default to UTC."""
+        _parse_schedule_time.cache_clear()
+        first = _parse_schedule_time("2030-01-01T00:00:00Z")
+        assert _parse_schedule_time("2030-01-01T00:00:00Z") is first
+        assert _parse_schedule_time.cache_info().hits == 1
+        assert first == datetime(2030, 1, 1, tzinfo=timezone.utc)
+        assert _parse_schedule_time("2030-01-01T00:00:00") == first
+    
+    def test_epoch_seconds_schedule(self, schedule_manager):
+        """Test that a bare epoch-seconds schedule is a one-time UTC job."""
+        job = Job.from_dict({
+            "job_id": "epoch-job",
+            "schedule": 1893456000,
+            "task": {"type": "execute_command", "command": "echo 'test'"}
+        })
+        assert job.is_one_time_schedule()
+        
+        scheduled_job = schedule_manager.create_scheduled_job(job)
+        assert scheduled_job.schedule_time == datetime(2030, 1, 1, tzinfo=timezone.utc)
+        
+        job = Job("too-big", "", "9" * 30, ExecuteCommandTask("echo 'test'"))
+        assert schedule_manager.create_scheduled_job(job) is None
+    
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="compact ISO 8601 needs Python 3.11")
+    def test_compact_iso_date_not_read_as_epoch(self):
+        """Test that an all-digit compact ISO 8601 date still parses as that date."""
+        assert _parse_schedule_time("20300101") == datetime(2030, 1, 1, tzinfo=timezone.utc)
+        assert _parse_schedule_time("1893456000") == datetime(2030, 1, 1, tzinfo=timezone.utc)
@@ -31,6 +31,26 @@ class TestScheduledJob:
         
         scheduled_job.cancel()
         assert scheduled_job.cancelled
+    
+    def test_command_extractor(self):
+        """Test the command extractor is resolved from the task type."""
+        task = ExecuteCommandTask("echo 'test'")
+        job = Job("test", "", "0 * * * *", task)
+        scheduled_job = ScheduledJob(job)
+        
+        assert scheduled_job.command_extractor(task) == "echo 'test'"
+    
+    def test_no_instance_dict(self):
+        """Test scheduled jobs use slots instead of a per-instance __dict__."""
+        task = ExecuteCommandTask("echo 'test'")
+        job = Job("test", "", "0 * * * *", task)
+        cron = croniter("0 * * * *", datetime.now(timezone.utc))
+        
+        for scheduled_job in (
+            OneTimeScheduledJob(job, datetime.now(timezone.utc)),
+            RecurringScheduledJob(job, cron),
+        ):
+            assert not hasattr(scheduled_job, '__dict__')
 
 
 class TestOneTimeScheduledJob:
@@ -72,6 +92,23 @@ class TestOneTimeScheduledJob:
         scheduled_job = OneTimeScheduledJob(job, past_time)
         scheduled_job.cancel()
         assert not scheduled_job.should_run()
+    
+    def test_post_execute_removes_only_itself(self, tmp_path):
+        """Test that a fired one-time job leaves a replacement in place."""
+        from job_scheduler.core import JobScheduler
+        
+        scheduler = JobScheduler(log_directory=str(tmp_path))
+        task = ExecuteCommandTask("echo 'test'")
+        job = Job("test", "", "2020-01-01T00:00:00Z", task)
+        fired = OneTimeScheduledJob(job, datetime.now(timezone.utc))
+        replacement = OneTimeScheduledJob(job, datetime.now(timezone.utc) + timedelta(hours=1))
+        
+        scheduler.scheduled_jobs["test"] = replacement
+        fired.post_execute(scheduler)
+        assert scheduler.scheduled_jobs["test"] is replacement
+        
+        replacement.post_execute(scheduler)
+        assert "test" not in scheduler.scheduled_jobs
 
 
 class TestRecurringScheduledJob:
@@ -100,6 +137,23 @@ class TestRecurringScheduledJob:
         assert scheduled_job.next_run_time != old_next_run
         assert scheduled_job.next_run_time > old_next_run
     
+    @pytest.mark.parametrize("schedule", [
+        "*/5 * * * *", "15 */6 * * *", "30 2 * * *", "*/7 * * * *",
+        "45 9 * * 3", "@hourly", "@daily", "@weekly",
+    ])
+    def test_reschedule_matches_croniter(self, schedule):
+        """Test that fast-step rescheduling agrees with croniter."""
+        task = ExecuteCommandTask("echo 'test'")
+        job = Job("test", "", schedule, task)
+        start = datetime(2025, 3, 30, 0, 7, tzinfo=timezone.utc)
+        reference = croniter(schedule, start)
+        reference.get_next(datetime)
+        
+        scheduled_job = RecurringScheduledJob(job, croniter(schedule, start))
+        for _ in range(100):
+            scheduled_job.reschedule()
+            assert scheduled_job.next_run_time == reference.get_next(datetime)
+    
     def test_should_run_cancelled(self):
         """Test should_run when cancelled."""
         task = ExecuteCommandTask("echo 'test'")
@@ -122,3 +176,13 @@ class TestRecurringScheduledJob:
         scheduled_job.mark_executed()
         assert scheduled_job.last_check_time >= old_check_time
 
+    
+    def test_should_run_with_explicit_now(self):
+        """Test should_run against a caller-supplied epoch."""
+        task = ExecuteCommandTask("echo 'test'")
+        job = Job("test", "", "0 * * * *", task)
+        cron = croniter("0 * * * *", datetime.now(timezone.utc))
+        
+        scheduled_job = RecurringScheduledJob(job, cron)
+        assert not scheduled_job.should_run(scheduled_job.next_run_epoch - 1)
+        assert scheduled_job.should_run(scheduled_job.next_run_epoch)
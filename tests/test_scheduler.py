@@ -1,13 +1,18 @@
 """Tests for the core scheduler."""
+import threading
 import time
 import tempfile
 import shutil
+from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import pytest
 
 from job_scheduler.core import JobScheduler
 from job_scheduler.watchers import JobFileWatcher
 from job_scheduler.models import Job, ExecuteCommandTask
+from job_scheduler.utils.config import settings
+
+from tests.conftest import wait_until
 
 
 class TestJobScheduler:
@@ -20,6 +25,21 @@ class TestJobScheduler:
         assert not scheduler.running
         assert len(scheduler.jobs) == 0
     
+    def test_worker_pool_sized_from_settings(self):
+        """Test that the worker pool defaults to settings.max_concurrent_jobs."""
+        assert JobScheduler().job_executor.max_workers == settings.max_concurrent_jobs
+        assert JobScheduler(max_workers=3).job_executor.max_workers == 3
+    
+    def test_task_type_workers_from_settings(self, monkeypatch):
+        """Test that dedicated task type pools default to settings.task_type_workers."""
+        monkeypatch.setattr(settings, "task_type_workers", {"execute_command": 2})
+        assert JobScheduler().job_executor.task_type_workers == {"execute_command": 2}
+        
+        executor = JobScheduler(task_type_workers={"slow": 1}).job_executor
+        assert executor.task_type_workers == {"slow": 1}
+        assert executor._get_pool("slow") is not executor._get_pool("execute_command")
+        executor.shutdown()
+    
     def test_add_job(self):
         """Test adding a job to the scheduler."""
         scheduler = JobScheduler()
@@ -30,6 +50,38 @@ class TestJobScheduler:
         assert "test-job" in scheduler.jobs
         assert scheduler.jobs["test-job"] == job
     
+    def test_concurrent_add_job(self):
+        """Test that jobs added from several threads are all scheduled."""
+        scheduler = JobScheduler()
+        
+        def add_jobs(worker):
+            for i in range(50):
+                scheduler.add_job(Job(f"job-{worker}-{i}", "", "0 * * * *", ExecuteCommandTask("true")))
+        
+        threads = [threading.Thread(target=add_jobs, args=(w,)) for w in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(scheduler.jobs) == 400
+        assert len(scheduler.scheduled_jobs) == 400
+        assert len(scheduler._heap) == 400
+    
+    def test_re_adding_identical_job_keeps_schedule(self):
+        """Test that re-adding an unchanged job does not reschedule it."""
+        scheduler = JobScheduler()
+        job = Job("test-job", "Test job", "0 * * * *", ExecuteCommandTask("echo 'test'"))
+        scheduler.add_job(job)
+        scheduled_job = scheduler.scheduled_jobs["test-job"]
+        
+        scheduler.add_job(Job("test-job", "Test job", "0 * * * *", ExecuteCommandTask("echo 'test'")))
+        assert scheduler.scheduled_jobs["test-job"] is scheduled_job
+        
+        scheduler.add_job(Job("test-job", "Changed", "0 * * * *", ExecuteCommandTask("echo 'test'")))
+        assert scheduler.scheduled_jobs["test-job"] is not scheduled_job
+        assert scheduled_job.cancelled
+    
     def test_remove_job(self):
         """Test removing a job from the scheduler."""
         scheduler = JobScheduler()
@@ -83,6 +135,63 @@ class TestJobScheduler:
         scheduler.add_job(job)
         # Should not be scheduled
         assert "test-job" not in scheduler.scheduled_jobs or "test-job" not in scheduler.jobs
+    
+    def test_job_added_while_running_fires_on_time(self, tmp_path):
+        """Test that the loop wakes for a job added after it went idle."""
+        scheduler = JobScheduler(log_directory=str(tmp_path))
+        scheduler.start()
+        time.sleep(0.1)  # Let the loop block on an empty heap
+        
+        fire_time = datetime.now(timezone.utc) + timedelta(milliseconds=300)
+        job = Job("soon-job", "Soon", fire_time.isoformat(), ExecuteCommandTask("true"))
+        scheduler.add_job(job)
+        assert "soon-job" in scheduler.scheduled_jobs
+        
+        time.sleep(0.6)
+        scheduler.stop()
+        # One-time jobs are dropped from the schedule once they have run
+        assert "soon-job" not in scheduler.scheduled_jobs
+        assert (tmp_path / "soon-job").exists()
+    
+    def test_recurring_job_survives_dispatch_error(self, tmp_path):
+        """Test that a recurring job keeps firing after one failed dispatch."""
+        scheduler = JobScheduler(log_directory=str(tmp_path))
+        scheduler.add_job(Job("flaky-job", "Flaky", "* * * * *", ExecuteCommandTask("true")))
+        scheduled_job = scheduler.scheduled_jobs["flaky-job"]
+        with scheduler.lock:
+            # Fire soon and every 0.1s instead of once a minute
+            scheduled_job.next_run_epoch = time.time() + 0.1
+            scheduled_job._fast_step = 0.1
+            scheduler._heap.clear()
+            scheduler._push(scheduled_job)
+        
+        calls = []
+        
+        def execute(job):
+            calls.append(job)
+            if len(calls) == 1:
+                raise RuntimeError("pool unavailable")
+        
+        scheduler.job_executor.execute = execute
+        scheduler.start()
+        wait_until(lambda: len(calls) >= 3)
+        scheduler.stop()
+        
+        assert len(calls) >= 3
+        assert scheduler.scheduled_jobs["flaky-job"] is scheduled_job
+    
+    def test_removed_job_is_not_executed(self, tmp_path):
+        """Test that cancelled heap entries are skipped."""
+        scheduler = JobScheduler(log_directory=str(tmp_path))
+        fire_time = datetime.now(timezone.utc) + timedelta(milliseconds=200)
+        job = Job("gone-job", "Gone", fire_time.isoformat(), ExecuteCommandTask("true"))
+        scheduler.add_job(job)
+        scheduler.remove_job("gone-job")
+        
+        scheduler.start()
+        time.sleep(0.5)
+        scheduler.stop()
+        assert not (tmp_path / "gone-job").exists()
 
 
 class TestFileWatcher:
@@ -140,8 +249,7 @@ class TestFileWatcher:
   }
 }""")
         
-        # Wait for watcher to detect
-        time.sleep(3)
+        wait_until(lambda: "new-job" in scheduler.jobs)
         assert "new-job" in scheduler.jobs
         
         watcher.stop()
@@ -170,7 +278,7 @@ class TestFileWatcher:
         job_file.unlink()
         
         watcher.start()
-        time.sleep(3)
+        wait_until(lambda: "test-job" not in scheduler.jobs)
         watcher.stop()
         
         # Job should be removed
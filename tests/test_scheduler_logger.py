@@ -0,0 +1,47 @@
+"""Tests for the scheduler logger."""
+from datetime import datetime, timezone
+
+from job_scheduler.logging import SchedulerLogger
+
+
+class TestSchedulerLogger:
+    """Test cases for SchedulerLogger."""
+    
+    def test_events_written_immediately(self, tmp_path):
+        """Test that each event line is visible without closing the logger."""
+        scheduler_logger = SchedulerLogger(str(tmp_path))
+        scheduler_logger.log_add("job-1", "* * * * *")
+        scheduler_logger.log_delete("job-1")
+        
+        lines = (tmp_path / "scheduler.log").read_text().splitlines()
+        assert len(lines) == 2
+        assert "ADD job_id=job-1 new_schedule=* * * * *" in lines[0]
+        assert "DELETE job_id=job-1" in lines[1]
+        scheduler_logger.close()
+    
+    def test_logging_after_close_reopens(self, tmp_path):
+        """Test that the log file is reopened for events after close()."""
+        scheduler_logger = SchedulerLogger(str(tmp_path))
+        scheduler_logger.log_start()
+        scheduler_logger.close()
+        scheduler_logger.log_error(error_msg="late error")
+        scheduler_logger.close()
+        
+        lines = (tmp_path / "scheduler.log").read_text().splitlines()
+        assert len(lines) == 2
+        assert lines[1].endswith("ERROR error=late error")
+    
+    def test_timestamp_is_utc_iso8601(self, tmp_path):
+        """Test that event timestamps parse as UTC ISO 8601 with microseconds."""
+        scheduler_logger = SchedulerLogger(str(tmp_path))
+        before = datetime.now(timezone.utc)
+        scheduler_logger.log_start()
+        after = datetime.now(timezone.utc)
+        scheduler_logger.close()
+        
+        line = (tmp_path / "scheduler.log").read_text()
+        timestamp = line[1:line.index("]")]
+        assert len(timestamp) == len("2025-01-01T00:00:00.000000+00:00")
+        parsed = datetime.fromisoformat(timestamp)
+        assert parsed.utcoffset().total_seconds() == 0
+        assert before <= parsed <= after